@@ -4,12 +4,14 @@ Implements transparent step-by-step analysis with validation checks
 """
 
 import psycopg
+from psycopg import sql
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
 import os
+import asyncio
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from sanity_checker import SanityChecker
 from eda_analyzer import EDAAnalyzer
@@ -18,6 +20,9 @@ from diagnostic_analyzer import DiagnosticAnalyzer
 
 load_dotenv()
 
+# Placeholder values for a parameterized query (positional or named)
+QueryParams = Union[Sequence[Any], Dict[str, Any]]
+
 
 @dataclass
 class AnalysisStep:
@@ -64,15 +69,19 @@ class AnalysisFramework:
         self.text_classifier: Optional[TextClassifier] = None
         self.diagnostic_analyzer: Optional[DiagnosticAnalyzer] = None
         
+    def _connection_params(self) -> Dict[str, Any]:
+        """Database connection parameters from environment settings"""
+        return {
+            'host': os.getenv("SUPABASE_HOST"),
+            'port': os.getenv("SUPABASE_PORT", "5432"),
+            'dbname': os.getenv("SUPABASE_DB"),
+            'user': os.getenv("SUPABASE_USER"),
+            'password': os.getenv("SUPABASE_PASSWORD")
+        }
+    
     def connect(self):
         """Establish database connection"""
-        self.connection = psycopg.connect(
-            host=os.getenv("SUPABASE_HOST"),
-            port=os.getenv("SUPABASE_PORT", "5432"),
-            dbname=os.getenv("SUPABASE_DB"),
-            user=os.getenv("SUPABASE_USER"),
-            password=os.getenv("SUPABASE_PASSWORD")
-        )
+        self.connection = psycopg.connect(**self._connection_params())
         # Initialize analyzers
         if self.connection:
             self.sanity_checker = SanityChecker(self.connection)
@@ -85,6 +94,45 @@ class AnalysisFramework:
         if self.connection:
             self.connection.close()
     
+    @contextmanager
+    def read_only_session(self, work_mem: str = "64MB"):
+        """
+        Run a block of introspection/EDA queries in one read-only transaction
+        
+        The transaction is REPEATABLE READ, so all queries share one snapshot;
+        aggregates get a larger work_mem so they don't spill to disk, and JIT
+        is disabled since its compile time outweighs the benefit on small
+        analytical queries. Both settings are SET LOCAL and end with the block.
+        
+        The block must start its own transaction, so one left open implicitly
+        by earlier queries is committed first (psycopg refuses this inside an
+        explicit connection.transaction() block); a failed transaction raises
+        ValueError.
+        
+        Usage:
+            with framework.read_only_session():
+                framework.run_sanity_checks("users")
+                framework.run_eda("users")
+        """
+        if not self.connection:
+            raise ValueError("Not connected to database. Call connect() first.")
+        
+        # Inside an open transaction, transaction() would only create a
+        # savepoint: no snapshot or READ ONLY, and SET LOCAL would outlive the block
+        status = self.connection.info.transaction_status
+        if status == psycopg.pq.TransactionStatus.INTRANS:
+            self.connection.commit()
+        elif status != psycopg.pq.TransactionStatus.IDLE:
+            raise ValueError(f"Cannot start a read-only session: connection is {status.name}")
+        
+        with self.connection.transaction():
+            self.connection.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+            self.connection.execute(
+                sql.SQL("SET LOCAL work_mem = {}").format(sql.Literal(work_mem))
+            )
+            self.connection.execute("SET LOCAL jit = off")
+            yield
+    
     def get_table_metadata(self, table_name: str) -> Dict[str, Any]:
         """
         Get metadata about a table for performance optimization
@@ -178,26 +226,31 @@ class AnalysisFramework:
         
         return considerations
     
-    def execute_query(self, query: str, explain: bool = True) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def execute_query(
+        self,
+        query: str,
+        explain: bool = True,
+        params: Optional[QueryParams] = None
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Execute query with performance monitoring
+        
+        Parameterized queries (placeholders such as %(status)s plus params) are
+        prepared server-side, so every variant of the same template reuses one
+        parsed and planned statement for the rest of the session.
+        
         Returns: (DataFrame, execution metadata)
         """
         start_time = datetime.now()
         
-        # Get EXPLAIN plan if requested
+        # Get EXPLAIN plan if requested; it runs on the same connection so the
+        # plan reflects the session's settings (work_mem, search_path, temp tables)
         explain_info = {}
         if explain:
-            try:
-                explain_query = f"EXPLAIN (FORMAT JSON) {query}"
-                explain_df = pd.read_sql_query(explain_query, self.connection)
-                if not explain_df.empty:
-                    explain_info = json.loads(explain_df.iloc[0, 0])[0]
-            except:
-                pass
+            explain_info = self._explain_query(query, params)
         
         # Execute main query
-        result_df = pd.read_sql_query(query, self.connection)
+        result_df = self._read_query(query, params)
         
         execution_time = (datetime.now() - start_time).total_seconds()
         
@@ -210,13 +263,41 @@ class AnalysisFramework:
         
         return result_df, metadata
     
+    def _read_query(self, query: str, params: Optional[QueryParams] = None) -> pd.DataFrame:
+        """Load a query result into a DataFrame, preparing parameterized queries"""
+        if params is None:
+            return pd.read_sql_query(query, self.connection)
+        
+        with self.connection.cursor() as cur:
+            cur.execute(query, params, prepare=True)
+            if cur.description is None:
+                return pd.DataFrame()
+            columns = [col.name for col in cur.description]
+            return pd.DataFrame.from_records(cur.fetchall(), columns=columns, coerce_float=True)
+    
+    def _explain_query(self, query: str, params: Optional[QueryParams] = None) -> Dict[str, Any]:
+        """Return the JSON EXPLAIN plan for a query, or {} if it cannot be planned"""
+        explain_query = f"EXPLAIN (FORMAT JSON) {query}"
+        try:
+            # A failed EXPLAIN only rolls back its own savepoint, leaving any
+            # transaction the caller has open (e.g. read_only_session) usable
+            with self.connection.transaction():
+                # psycopg's json loader returns the plan already parsed
+                with self.connection.cursor() as cur:
+                    cur.execute(explain_query, params)
+                    row = cur.fetchone()
+        except psycopg.Error:
+            return {}
+        return row[0][0] if row else {}
+    
     def validate_aggregation(
         self, 
         aggregation_query: str,
         aggregation_column: str,
         segment_columns: List[str],
         table_name: str,
-        num_cases: int = 3
+        num_cases: int = 3,
+        params: Optional[QueryParams] = None
     ) -> List[ValidationCase]:
         """
         Validate aggregation by checking 2-3 raw data cases
@@ -227,34 +308,36 @@ class AnalysisFramework:
             segment_columns: Columns used for grouping/segmentation
             table_name: Base table name
             num_cases: Number of validation cases to check
+            params: Parameters for a parameterized aggregation query
         """
         validation_cases = []
         
         # First, get the aggregated results
-        agg_df, _ = self.execute_query(aggregation_query, explain=False)
+        agg_df, _ = self.execute_query(aggregation_query, explain=False, params=params)
         
         # Select a few segments to validate
         sample_segments = agg_df.head(num_cases)
         
         for idx, segment_row in sample_segments.iterrows():
-            # Build WHERE clause for this segment
-            where_conditions = []
-            for col in segment_columns:
-                if col in segment_row and pd.notna(segment_row[col]):
-                    if isinstance(segment_row[col], str):
-                        where_conditions.append(f"{col} = '{segment_row[col]}'")
-                    else:
-                        where_conditions.append(f"{col} = {segment_row[col]}")
-            
-            where_clause = " AND ".join(where_conditions)
+            # Build WHERE clause for this segment; psycopg quotes each literal
+            # by type, so strings with apostrophes, dates and UUIDs are safe
+            segment_values = segment_row.to_dict()
+            where_conditions = [
+                sql.SQL("{} = {}").format(sql.Identifier(col), sql.Literal(segment_values[col]))
+                for col in segment_columns
+                if col in segment_values and pd.notna(segment_values[col])
+            ]
+            where_clause = sql.SQL(" AND ").join(where_conditions) if where_conditions else sql.SQL("TRUE")
             
             # Query raw data for this segment
-            raw_data_query = f"""
+            raw_data_query = sql.SQL("""
                 SELECT * 
-                FROM {table_name}
-                WHERE {where_clause}
+                FROM {}
+                WHERE {}
                 LIMIT 100;
-            """
+            """).format(
+                sql.Identifier(*table_name.split('.')), where_clause
+            ).as_string(self.connection)
             
             raw_df, _ = self.execute_query(raw_data_query, explain=False)
             
@@ -304,7 +387,8 @@ class AnalysisFramework:
         validate: bool = False,
         aggregation_column: str = None,
         segment_columns: List[str] = None,
-        table_name: str = None
+        table_name: str = None,
+        params: Optional[QueryParams] = None
     ) -> AnalysisStep:
         """
         Add a new analysis step with full transparency
@@ -318,6 +402,9 @@ class AnalysisFramework:
             aggregation_column: Column being aggregated (for validation)
             segment_columns: Columns used for grouping (for validation)
             table_name: Base table name (for validation)
+            params: Values for placeholders in query (e.g. {'status': 'active'});
+                the query is then prepared once and its plan reused for later
+                steps sharing the same template
         """
         step_num = len(self.steps) + 1
         
@@ -328,7 +415,7 @@ class AnalysisFramework:
         perf_considerations = self.check_performance_considerations(query, tables)
         
         # Execute query
-        result_df, metadata = self.execute_query(query)
+        result_df, metadata = self.execute_query(query, params=params)
         
         # Create step
         step = AnalysisStep(
@@ -345,30 +432,256 @@ class AnalysisFramework:
                 'tables_used': tables
             }
         )
+        if params is not None:
+            step.metadata['params'] = params
         
         # Validate if requested
         if validate and aggregation_column and segment_columns and table_name:
-            validation_cases = self.validate_aggregation(
-                query, aggregation_column, segment_columns, table_name
+            self._validate_step(step, aggregation_column, segment_columns, table_name)
+        
+        self.steps.append(step)
+        return step
+    
+    def add_steps_pipelined(self, step_specs: List[Dict[str, Any]]) -> List[AnalysisStep]:
+        """
+        Add several independent analysis steps, sending all queries in one batch
+        
+        Queries are dispatched through a psycopg pipeline so the client does not
+        wait for each result before sending the next statement; the batch costs
+        roughly one network round-trip instead of one per step.
+        
+        Args:
+            step_specs: List of step definitions, each accepting the same keys
+                as add_step (description, query, assumptions, clarifications,
+                validate, aggregation_column, segment_columns, table_name,
+                params)
+        
+        Returns:
+            The created steps, in the order given
+        """
+        if not step_specs:
+            return []
+        
+        # Performance checks only read (cached) table metadata, so run them
+        # before the batch is dispatched
+        tables_per_step = [self._extract_table_names(spec['query']) for spec in step_specs]
+        perf_per_step = [
+            self.check_performance_considerations(spec['query'], tables)
+            for spec, tables in zip(step_specs, tables_per_step)
+        ]
+        
+        start_time = datetime.now()
+        cursors = []
+        with self.connection.pipeline():
+            for spec in step_specs:
+                cur = self.connection.cursor()
+                params = spec.get('params')
+                cur.execute(spec['query'], params, prepare=True if params is not None else None)
+                cursors.append(cur)
+        
+        results = []
+        for cur in cursors:
+            columns = [col.name for col in cur.description] if cur.description else []
+            results.append(pd.DataFrame(cur.fetchall(), columns=columns))
+            cur.close()
+        
+        # Per-query timings are not observable inside a pipeline; spread the
+        # batch time evenly so total_execution_time stays accurate
+        execution_time = (datetime.now() - start_time).total_seconds() / len(step_specs)
+        
+        return [
+            self._record_batched_step(
+                spec, tables, perf_considerations, result_df, execution_time, {'pipelined': True}
             )
-            step.validation_results = {
-                'cases': [
-                    {
-                        'case_id': case.case_id,
-                        'description': case.description,
-                        'passed': case.passed,
-                        'expected': case.expected_value,
-                        'actual': case.actual_value,
-                        'notes': case.notes
-                    }
-                    for case in validation_cases
-                ],
-                'all_passed': all(c.passed for c in validation_cases if c.passed is not None)
+            for spec, tables, perf_considerations, result_df in zip(
+                step_specs, tables_per_step, perf_per_step, results
+            )
+        ]
+    
+    async def add_steps_async(
+        self,
+        step_specs: List[Dict[str, Any]],
+        max_connections: int = 4
+    ) -> List[AnalysisStep]:
+        """
+        Add several independent analysis steps, executing their queries concurrently
+        
+        Each query runs on an async psycopg connection drawn from a small set
+        opened for the batch, so wall-clock time approaches the slowest step
+        rather than the sum of all steps.
+        
+        Args:
+            step_specs: List of step definitions (same keys as add_steps_pipelined)
+            max_connections: Maximum number of queries in flight at once
+        
+        Returns:
+            The created steps, in the order given
+        
+        Usage:
+            steps = await framework.add_steps_async([...])
+        """
+        if not step_specs:
+            return []
+        
+        tables_per_step = [self._extract_table_names(spec['query']) for spec in step_specs]
+        perf_per_step = [
+            self.check_performance_considerations(spec['query'], tables)
+            for spec, tables in zip(step_specs, tables_per_step)
+        ]
+        
+        connections = await asyncio.gather(*(
+            psycopg.AsyncConnection.connect(**self._connection_params())
+            for _ in range(min(max_connections, len(step_specs)))
+        ))
+        available = asyncio.Queue()
+        for conn in connections:
+            available.put_nowait(conn)
+        
+        async def run_query(query: str, params: Optional[QueryParams]) -> Tuple[pd.DataFrame, float]:
+            conn = await available.get()
+            try:
+                start_time = datetime.now()
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params, prepare=True if params is not None else None)
+                    columns = [col.name for col in cur.description] if cur.description else []
+                    rows = await cur.fetchall()
+                return pd.DataFrame(rows, columns=columns), (datetime.now() - start_time).total_seconds()
+            finally:
+                available.put_nowait(conn)
+        
+        try:
+            results = await asyncio.gather(*(run_query(spec['query'], spec.get('params')) for spec in step_specs))
+        finally:
+            for conn in connections:
+                await conn.close()
+        
+        return [
+            self._record_batched_step(
+                spec, tables, perf_considerations, result_df, execution_time, {'concurrent': True}
+            )
+            for spec, tables, perf_considerations, (result_df, execution_time) in zip(
+                step_specs, tables_per_step, perf_per_step, results
+            )
+        ]
+    
+    def _record_batched_step(
+        self,
+        spec: Dict[str, Any],
+        tables: List[str],
+        perf_considerations: Dict[str, Any],
+        result_df: pd.DataFrame,
+        execution_time: float,
+        extra_metadata: Dict[str, Any]
+    ) -> AnalysisStep:
+        """Create, validate (if requested) and record a step whose query already ran"""
+        step = AnalysisStep(
+            step_number=len(self.steps) + 1,
+            description=spec['description'],
+            query=spec['query'],
+            assumptions=spec.get('assumptions') or [],
+            clarifications_needed=spec.get('clarifications') or [],
+            execution_time=execution_time,
+            row_count=len(result_df),
+            metadata={
+                'performance': perf_considerations,
+                'columns': list(result_df.columns),
+                'tables_used': tables,
+                **extra_metadata
             }
+        )
+        if spec.get('params') is not None:
+            step.metadata['params'] = spec['params']
+        
+        if (spec.get('validate') and spec.get('aggregation_column')
+                and spec.get('segment_columns') and spec.get('table_name')):
+            self._validate_step(
+                step, spec['aggregation_column'], spec['segment_columns'], spec['table_name']
+            )
         
         self.steps.append(step)
         return step
     
+    def add_merged_step(self, step_specs: List[Dict[str, Any]], merged_query: str) -> List[AnalysisStep]:
+        """
+        Add several steps answered by a single merged query
+        
+        Use when multiple probes scan the same table (e.g. row counts and
+        data-quality counts): the aggregates are computed in one pass and each
+        step reports its own slice of the result columns.
+        
+        Args:
+            step_specs: List of step definitions with:
+                - description: What this step does
+                - columns: Result columns belonging to this step
+                - assumptions: Optional list of assumptions
+                - clarifications: Optional list of clarification questions
+            merged_query: SQL query returning the columns of every step
+        
+        Returns:
+            The created steps, in the order given
+        """
+        if not step_specs:
+            return []
+        
+        tables = self._extract_table_names(merged_query)
+        perf_considerations = self.check_performance_considerations(merged_query, tables)
+        
+        result_df, metadata = self.execute_query(merged_query)
+        
+        # One scan serves every step; spread its time so totals stay accurate
+        execution_time = metadata['execution_time'] / len(step_specs)
+        
+        steps = []
+        for spec in step_specs:
+            step_columns = [col for col in spec['columns'] if col in result_df.columns]
+            step = AnalysisStep(
+                step_number=len(self.steps) + 1,
+                description=spec['description'],
+                query=merged_query,
+                assumptions=spec.get('assumptions') or [],
+                clarifications_needed=spec.get('clarifications') or [],
+                execution_time=execution_time,
+                row_count=metadata['row_count'],
+                metadata={
+                    'performance': perf_considerations,
+                    'columns': step_columns,
+                    'tables_used': tables,
+                    'merged': True,
+                    'results': result_df[step_columns].to_dict('records')
+                }
+            )
+            self.steps.append(step)
+            steps.append(step)
+        
+        return steps
+    
+    def _validate_step(
+        self,
+        step: AnalysisStep,
+        aggregation_column: str,
+        segment_columns: List[str],
+        table_name: str
+    ):
+        """Run aggregation validation for a step and store the results on it"""
+        validation_cases = self.validate_aggregation(
+            step.query, aggregation_column, segment_columns, table_name,
+            params=step.metadata.get('params')
+        )
+        step.validation_results = {
+            'cases': [
+                {
+                    'case_id': case.case_id,
+                    'description': case.description,
+                    'passed': case.passed,
+                    'expected': case.expected_value,
+                    'actual': case.actual_value,
+                    'notes': case.notes
+                }
+                for case in validation_cases
+            ],
+            'all_passed': all(c.passed for c in validation_cases if c.passed is not None)
+        }
+    
     def _extract_table_names(self, query: str) -> List[str]:
         """Extract table names from SQL query"""
         import re
@@ -605,6 +918,12 @@ class AnalysisFramework:
         # Get data
         df, metadata = self.execute_query(query, explain=False)
         
+        # Segment columns are low-cardinality: categoricals shrink memory and
+        # let the analyzer group on integer codes instead of Python strings
+        for col in segment_columns:
+            if col in df.columns and df[col].dtype == object:
+                df[col] = df[col].astype('category')
+        
         # Run diagnostic analysis
         results = self.diagnostic_analyzer.diagnostic_analysis(
             df, target_column, segment_columns
@@ -33,7 +33,8 @@ class AnalysisRunner:
         
         print("✅ Analysis framework initialized")
     
-    def run_analysis(self, question: str, steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def run_analysis(self, question: str, steps: List[Dict[str, Any]],
+                     pipelined: bool = False) -> Dict[str, Any]:
         """
         Run a complete analysis workflow
         
@@ -48,6 +49,9 @@ class AnalysisRunner:
                 - aggregation_column: Column being aggregated
                 - segment_columns: Columns for grouping
                 - table_name: Base table name
+            pipelined: Send all queries as one pipelined batch. Faster over a
+                high-latency connection, but skips per-step EXPLAIN validation
+                and reports the batch time averaged across steps
         """
         # Add user context
         self.context.add_user_context(question)
@@ -60,10 +64,16 @@ class AnalysisRunner:
         if mapping.get('metrics'):
             print(f"📈 Metrics identified: {[m['name'] for m in mapping['metrics']]}")
         
-        # Execute each step
-        for step_def in steps:
-            step = self.framework.add_step(**step_def)
-            self.framework.print_step_summary(step)
+        if pipelined:
+            # Dispatch every step before printing so the queries go out as one
+            # pipelined batch instead of waiting on each summary in between
+            for step in self.framework.add_steps_pipelined(steps):
+                self.framework.print_step_summary(step)
+        else:
+            # Execute each step
+            for step_def in steps:
+                step = self.framework.add_step(**step_def)
+                self.framework.print_step_summary(step)
         
         # Get summary
         self.analysis_results = self.framework.get_analysis_summary()
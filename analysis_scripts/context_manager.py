@@ -2,13 +2,71 @@
 Context Manager - Combines schema from GitHub + user input + real-time data checks
 """
 
+import re
 import yaml
 import requests
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
+from functools import lru_cache
 from datetime import datetime
 
+# Optional: matches every schema name/synonym in one pass over the question
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: C-implemented JSON for context mapping files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C parser is much faster; fall back to pure Python if it's missing
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _tokenize(text: str) -> set:
+    """Split text into a set of lowercase word tokens"""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _copy_mapping(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a question mapping down to its entries' synonym lists
+    
+    Mappings only nest lists of flat entry dicts, so this is much cheaper
+    than copy.deepcopy while still sharing nothing mutable.
+    """
+    copied = {}
+    for key, value in mapping.items():
+        if isinstance(value, list):
+            value = [
+                {**entry, 'synonyms': list(entry['synonyms'])} if 'synonyms' in entry else dict(entry)
+                for entry in value
+            ]
+        copied[key] = value
+    return copied
+
+
+# Downloaded schema files are cached here, keyed by the commit SHA they were read at
+SCHEMA_CACHE_DIR = Path.home() / ".cache" / "ai-workshop"
+
+# Shared session so GitHub requests reuse one TLS connection
+REQUEST_TIMEOUT = 5
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'Accept-Encoding': 'gzip',
+    'User-Agent': 'ai-workshop-context-manager'
+})
+
 
 class ContextManager:
     """
@@ -25,16 +83,50 @@ class ContextManager:
         self.user_context: Dict[str, Any] = {}
         self.data_context: Dict[str, Any] = {}
         self.context_mapping: Dict[str, str] = {}
+        # Description token -> positions in schema 'models'
+        self._token_to_models: Dict[str, set] = {}
+        # Lowercased match terms, parallel to the schema lists
+        self._model_terms: List[tuple] = []
+        self._metric_terms: List[tuple] = []
+        self._business_question_terms: List[tuple] = []
+        # Model/metric name -> position, for business questions that declare them
+        self._model_positions: Dict[str, int] = {}
+        self._metric_positions: Dict[str, int] = {}
+        # Aho-Corasick automaton over names/synonyms (None without pyahocorasick)
+        self._phrase_automaton = None
+        # Question -> mapping memo, cleared whenever the schema changes
+        self._mapping_cache = lru_cache(maxsize=256)(self._compute_question_mapping)
         
     def load_schema_from_github(self, schema_file: str = "schema.yml") -> Dict[str, Any]:
         """
         Load schema context from GitHub repo
         """
         try:
-            url = f"https://raw.githubusercontent.com/{self.github_owner}/{self.github_repo}/main/{schema_file}"
-            response = requests.get(url)
+            # Pin to the current commit so the cached copy can be trusted as-is;
+            # if the SHA can't be resolved, revalidate the branch copy by ETag
+            sha = self._resolve_commit_sha()
+            ref = sha or "main"
+            cache_path = self._schema_cache_path(schema_file, ref)
+            cached = self._read_schema_cache(cache_path)
+            if sha and cached is not None:
+                self._set_schema_context(cached['schema'])
+                return self.schema_context
+            
+            headers = {}
+            if cached and cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            
+            url = f"https://raw.githubusercontent.com/{self.github_owner}/{self.github_repo}/{ref}/{schema_file}"
+            response = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached is not None:
+                self._set_schema_context(cached['schema'])
+                return self.schema_context
             if response.status_code == 200:
-                self.schema_context = yaml.safe_load(response.text)
+                self._set_schema_context(yaml.load(response.content, Loader=SafeLoader))
+                self._write_schema_cache(cache_path, {
+                    'etag': response.headers.get('ETag'),
+                    'content': response.content.decode('utf-8')
+                })
                 return self.schema_context
             else:
                 print(f"Warning: Could not load schema from GitHub (status {response.status_code})")
@@ -43,11 +135,158 @@ class ContextManager:
             print(f"Error loading schema from GitHub: {e}")
             return {}
     
+    def _set_schema_context(self, schema_context: Dict[str, Any]):
+        """Replace the schema context and rebuild the lookup indexes"""
+        self.schema_context = schema_context
+        self._build_schema_index()
+        self._mapping_cache.cache_clear()
+    
+    def _build_schema_index(self):
+        """
+        Build an inverted index over model descriptions so question mapping
+        only compares descriptions that share a word with the question, and
+        lowercase every match term once up front
+        """
+        self._token_to_models = {}
+        self._model_terms = []
+        self._metric_terms = []
+        self._business_question_terms = []
+        self._model_positions = {}
+        self._metric_positions = {}
+        schema = self.schema_context or {}
+        
+        for i, model in enumerate(schema.get('models') or []):
+            name_lc = model.get('name', '').lower()
+            synonyms_lc = tuple(syn.lower() for syn in model.get('synonyms', []))
+            desc_tokens = frozenset(_tokenize(model.get('description', '')))
+            self._model_terms.append((name_lc, synonyms_lc, desc_tokens))
+            self._model_positions.setdefault(model.get('name', ''), i)
+            
+            for token in desc_tokens:
+                self._token_to_models.setdefault(token, set()).add(i)
+        
+        for i, metric in enumerate(schema.get('common_metrics') or []):
+            name_lc = metric.get('name', '').lower()
+            synonyms_lc = tuple(syn.lower() for syn in metric.get('synonyms', []))
+            self._metric_terms.append((name_lc, synonyms_lc))
+            self._metric_positions.setdefault(metric.get('name', ''), i)
+        
+        for q in schema.get('common_business_questions') or []:
+            question_lc = q.get('question', '').lower()
+            self._business_question_terms.append((
+                question_lc,
+                tuple(syn.lower() for syn in q.get('synonyms', [])),
+                frozenset(_tokenize(question_lc))
+            ))
+        
+        self._phrase_automaton = self._build_phrase_automaton()
+    
+    def _build_phrase_automaton(self):
+        """Compile model/metric names and synonyms into one Aho-Corasick automaton"""
+        if ahocorasick is None:
+            return None
+        
+        # Several entries can share a phrase, so each key maps to a list of
+        # (kind, position, is_name) hits
+        phrases: Dict[str, List[tuple]] = {}
+        for i, (name_lc, synonyms_lc, _) in enumerate(self._model_terms):
+            phrases.setdefault(name_lc, []).append(('model', i, True))
+            for syn in synonyms_lc:
+                phrases.setdefault(syn, []).append(('model', i, False))
+        for i, (name_lc, synonyms_lc) in enumerate(self._metric_terms):
+            for phrase in (name_lc, *synonyms_lc):
+                phrases.setdefault(phrase, []).append(('metric', i, False))
+        phrases.pop('', None)
+        if not phrases:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for phrase, hits in phrases.items():
+            automaton.add_word(phrase, hits)
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan_phrases(self, question_lower: str) -> tuple:
+        """
+        Find every model/metric name or synonym contained in the question
+        
+        Uses the automaton when pyahocorasick is installed, otherwise checks
+        each phrase as a substring; both find the same hits.
+        
+        Returns:
+            (model_hits, metric_hits) where model_hits maps model position to
+            whether its name (not just a synonym) matched
+        """
+        model_hits: Dict[int, bool] = {}
+        metric_hits = set()
+        if self._phrase_automaton is not None:
+            for _, hits in self._phrase_automaton.iter(question_lower):
+                for kind, i, is_name in hits:
+                    if kind == 'model':
+                        model_hits[i] = model_hits.get(i, False) or is_name
+                    else:
+                        metric_hits.add(i)
+            return model_hits, metric_hits
+        
+        for i, (name_lc, synonyms_lc, _) in enumerate(self._model_terms):
+            if name_lc and name_lc in question_lower:
+                model_hits[i] = True
+            elif any(syn and syn in question_lower for syn in synonyms_lc):
+                model_hits[i] = False
+        for i, (name_lc, synonyms_lc) in enumerate(self._metric_terms):
+            if any(phrase and phrase in question_lower for phrase in (name_lc, *synonyms_lc)):
+                metric_hits.add(i)
+        return model_hits, metric_hits
+    
+    def _resolve_commit_sha(self, branch: str = "main") -> Optional[str]:
+        """Resolve the current commit SHA of a branch, or None if unavailable"""
+        try:
+            url = f"https://api.github.com/repos/{self.github_owner}/{self.github_repo}/commits/{branch}"
+            response = _SESSION.get(
+                url, headers={'Accept': 'application/vnd.github.sha'}, timeout=REQUEST_TIMEOUT
+            )
+            if response.status_code == 200:
+                return response.text.strip()
+        except Exception:
+            pass
+        return None
+    
+    def _schema_cache_path(self, schema_file: str, ref: str) -> Path:
+        """Cache file for a schema file at a given git ref"""
+        name = f"{self.github_owner}_{self.github_repo}_{Path(schema_file).stem}-{ref}.json"
+        return SCHEMA_CACHE_DIR / name
+    
+    def _read_schema_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached entry as {'etag', 'schema'}, or None on a miss
+        
+        Entries hold the downloaded YAML text rather than a serialized
+        object, so a tampered cache file is parsed as safely as a download.
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return {
+                'etag': entry.get('etag'),
+                'schema': yaml.load(entry['content'], Loader=SafeLoader)
+            }
+        except Exception:
+            return None
+    
+    def _write_schema_cache(self, cache_path: Path, entry: Dict[str, Any]):
+        """Write an {'etag', 'content'} cache entry; failures only cost a re-download next time"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        except OSError as e:
+            print(f"Warning: Could not write schema cache: {e}")
+    
     def load_schema_from_local(self, schema_path: str) -> Dict[str, Any]:
         """Load schema from local file"""
         try:
-            with open(schema_path, 'r') as f:
-                self.schema_context = yaml.safe_load(f)
+            with open(schema_path, 'rb') as f:
+                self._set_schema_context(yaml.load(f, Loader=SafeLoader))
             return self.schema_context
         except Exception as e:
             print(f"Error loading local schema: {e}")
@@ -106,7 +345,14 @@ class ContextManager:
     def map_user_question_to_schema(self, question: str) -> Dict[str, Any]:
         """
         Map user question to schema elements using synonyms and descriptions
+        
+        Results are memoized per question until the schema is reloaded;
+        callers get their own copy, so mutating it can't affect later lookups.
         """
+        return _copy_mapping(self._mapping_cache(question))
+    
+    def _compute_question_mapping(self, question: str) -> Dict[str, Any]:
+        """Uncached implementation of map_user_question_to_schema"""
         mapping = {
             'tables': [],
             'columns': [],
@@ -115,52 +361,107 @@ class ContextManager:
         }
         
         question_lower = question.lower()
+        question_tokens = _tokenize(question)
+        
+        # A curated question asked verbatim or matched by one of its synonyms
+        # is a strong match: its declared tables/metrics answer the mapping
+        # without a full scan. A weaker word-overlap match only supplies the
+        # query pattern; the tables/metrics still come from the scan below
+        matched, strong = self._match_business_question(question_lower, question_tokens)
+        if matched is not None:
+            mapping['query_pattern'] = matched.get('query_pattern', '')
+            mapping['matched_question'] = matched.get('question', '')
+            if strong and (matched.get('tables') or matched.get('metrics')):
+                self._add_declared_entities(mapping, matched)
+                return mapping
+        
+        # Name/synonym mentions are substring matches ("users" mentions
+        # "user"), so they come from a phrase scan rather than the token index
+        model_hits, metric_hits = self._scan_phrases(question_lower)
         
         # Check for table matches
         if 'models' in self.schema_context:
-            for model in self.schema_context['models']:
-                table_name = model.get('name', '')
-                synonyms = model.get('synonyms', [])
-                description = model.get('description', '')
+            models = self.schema_context['models']
+            candidates = set().union(*(self._token_to_models.get(t, ()) for t in question_tokens))
+            candidates.update(model_hits)
+            for i in sorted(candidates):
+                model = models[i]
+                name_matched = model_hits.get(i, False)
                 
                 # Check if question mentions table or synonyms
-                if (table_name.lower() in question_lower or
-                    any(syn.lower() in question_lower for syn in synonyms) or
-                    any(word in description.lower() for word in question_lower.split())):
-                    mapping['tables'].append({
-                        'name': table_name,
-                        'confidence': 'high' if table_name.lower() in question_lower else 'medium',
-                        'synonyms': synonyms,
-                        'description': description
-                    })
+                if i in model_hits or not self._model_terms[i][2].isdisjoint(question_tokens):
+                    mapping['tables'].append(
+                        self._table_mapping_entry(model, 'high' if name_matched else 'medium')
+                    )
         
         # Check for metric matches
         if 'common_metrics' in self.schema_context:
-            for metric in self.schema_context['common_metrics']:
-                metric_name = metric.get('name', '')
-                synonyms = metric.get('synonyms', [])
-                
-                if (metric_name.lower() in question_lower or
-                    any(syn.lower() in question_lower for syn in synonyms)):
-                    mapping['metrics'].append({
-                        'name': metric_name,
-                        'calculation': metric.get('calculation', ''),
-                        'synonyms': synonyms
-                    })
-        
-        # Check for common business questions
-        if 'common_business_questions' in self.schema_context:
-            for q in self.schema_context['common_business_questions']:
-                question_text = q.get('question', '')
-                synonyms = q.get('synonyms', [])
-                
-                if (any(syn.lower() in question_lower for syn in synonyms) or
-                    any(word in question_text.lower() for word in question_lower.split()[:5])):
-                    mapping['query_pattern'] = q.get('query_pattern', '')
-                    mapping['matched_question'] = question_text
+            metrics = self.schema_context['common_metrics']
+            for i in sorted(metric_hits):
+                mapping['metrics'].append(self._metric_mapping_entry(metrics[i]))
         
         return mapping
     
+    def _match_business_question(self, question_lower: str, question_tokens: set) -> tuple:
+        """
+        Find the curated business question that best matches a user question
+        
+        The question text itself or one of its synonyms appearing in the user
+        question is a strong match and wins outright. Otherwise any
+        question sharing one of the first five words is a weak match, and
+        the one sharing the most words with the user question is chosen.
+        
+        Returns:
+            (business_question or None, whether the match is strong)
+        """
+        questions = self.schema_context.get('common_business_questions') or []
+        leading_words = question_lower.split()[:5]
+        best, best_score = None, -1
+        for q, (question_text_lc, synonyms_lc, text_tokens) in zip(questions, self._business_question_terms):
+            if (question_text_lc and question_text_lc in question_lower) or any(syn in question_lower for syn in synonyms_lc):
+                return q, True
+            if any(word in question_text_lc for word in leading_words):
+                score = len(text_tokens & question_tokens)
+                if score > best_score:
+                    best, best_score = q, score
+        return best, False
+    
+    def _add_declared_entities(self, mapping: Dict[str, Any], business_question: Dict[str, Any]):
+        """Add a business question's declared tables/metrics to the mapping, once each"""
+        models = self.schema_context.get('models') or []
+        metrics = self.schema_context.get('common_metrics') or []
+        table_names = {t['name'] for t in mapping['tables']}
+        metric_names = {m['name'] for m in mapping['metrics']}
+        for name in business_question.get('tables') or []:
+            if name in self._model_positions and name not in table_names:
+                mapping['tables'].append(
+                    self._table_mapping_entry(models[self._model_positions[name]], 'high')
+                )
+                table_names.add(name)
+        for name in business_question.get('metrics') or []:
+            if name in self._metric_positions and name not in metric_names:
+                mapping['metrics'].append(
+                    self._metric_mapping_entry(metrics[self._metric_positions[name]])
+                )
+                metric_names.add(name)
+    
+    def _table_mapping_entry(self, model: Dict[str, Any], confidence: str) -> Dict[str, Any]:
+        """Table entry for a question mapping"""
+        return {
+            'name': model.get('name', ''),
+            'confidence': confidence,
+            'synonyms': model.get('synonyms', []),
+            'description': model.get('description', '')
+        }
+    
+    def _metric_mapping_entry(self, metric: Dict[str, Any]) -> Dict[str, Any]:
+        """Metric entry for a question mapping"""
+        return {
+            'name': metric.get('name', ''),
+            'calculation': metric.get('calculation', ''),
+            'synonyms': metric.get('synonyms', [])
+        }
+    
     def get_query_suggestions(self, question: str) -> List[str]:
         """Get query suggestions based on context"""
         suggestions = []
@@ -185,26 +486,36 @@ class ContextManager:
         summary_parts = []
         
         # Schema context
-        if self.schema_context:
+        schema = self.schema_context
+        if schema:
             summary_parts.append("## Schema Context")
-            if 'models' in self.schema_context:
-                summary_parts.append(f"Available tables: {len(self.schema_context['models'])}")
-            if 'common_metrics' in self.schema_context:
-                summary_parts.append(f"Defined metrics: {len(self.schema_context['common_metrics'])}")
+            models = schema.get('models')
+            if models is not None:
+                summary_parts.append(f"Available tables: {len(models)}")
+            metrics = schema.get('common_metrics')
+            if metrics is not None:
+                summary_parts.append(f"Defined metrics: {len(metrics)}")
         
         # User context
-        if self.user_context:
-            summary_parts.append("\n## User Context")
-            summary_parts.append(f"Question: {self.user_context.get('question', 'N/A')}")
-            if self.user_context.get('clarifications'):
-                summary_parts.append(f"Clarifications: {len(self.user_context['clarifications'])} needed")
+        user = self.user_context
+        if user:
+            summary_parts.append("")
+            summary_parts.append("## User Context")
+            summary_parts.append(f"Question: {user.get('question', 'N/A')}")
+            clarifications = user.get('clarifications')
+            if clarifications:
+                summary_parts.append(f"Clarifications: {len(clarifications)} needed")
         
         # Data context
-        if self.data_context.get('tables'):
-            summary_parts.append("\n## Data Context")
-            for table_name, info in self.data_context['tables'].items():
+        tables = self.data_context.get('tables')
+        if tables:
+            summary_parts.append("")
+            summary_parts.append("## Data Context")
+            for table_name, info in tables.items():
                 row_count = info.get('row_count', 'unknown')
-                summary_parts.append(f"{table_name}: {row_count:,} rows")
+                # Metadata lookups that failed report row_count=None
+                row_count_text = f"{row_count:,}" if isinstance(row_count, int) else (row_count or 'unknown')
+                summary_parts.append(f"{table_name}: {row_count_text} rows")
         
         return "\n".join(summary_parts)
     
@@ -216,14 +527,26 @@ class ContextManager:
             'data_context': self.data_context,
             'context_mapping': self.context_mapping
         }
-        with open(filepath, 'w') as f:
-            json.dump(mapping, f, indent=2, default=str)
+        if orjson is not None:
+            # Datetimes are passed through to default=str so both backends
+            # write them in the same format
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    mapping,
+                    default=str,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME)
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(mapping, f, indent=2, default=str)
     
     def load_context_mapping(self, filepath: str):
         """Load context mapping from file"""
-        with open(filepath, 'r') as f:
-            mapping = json.load(f)
-        self.schema_context = mapping.get('schema_context', {})
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        mapping = orjson.loads(content) if orjson is not None else json.loads(content)
+        self._set_schema_context(mapping.get('schema_context', {}))
         self.user_context = mapping.get('user_context', {})
         self.data_context = mapping.get('data_context', {})
 
@@ -57,43 +57,49 @@ class DiagnosticAnalyzer:
             'significance_tests': {}
         }
         
-        # Calculate stats for each segment
-        for segment in unique_segments:
-            segment_data = df_filtered[df_filtered[segment_column] == segment][metric_column].dropna()
-            
-            if len(segment_data) > 0:
-                comparison['segment_stats'][segment] = {
-                    'count': int(len(segment_data)),
-                    'mean': float(segment_data.mean()),
-                    'median': float(segment_data.median()),
-                    'std': float(segment_data.std()),
-                    'min': float(segment_data.min()),
-                    'max': float(segment_data.max()),
-                    'q25': float(segment_data.quantile(0.25)),
-                    'q75': float(segment_data.quantile(0.75))
-                }
+        # Calculate stats for every segment in a single grouped pass
+        grouped = (
+            df_filtered.dropna(subset=[metric_column])
+            .groupby(segment_column, observed=True, sort=False)[metric_column]
+        )
+        segment_agg = grouped.agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+        segment_quartiles = grouped.quantile([0.25, 0.75]).unstack()
+        
+        for segment, row in segment_agg.iterrows():
+            comparison['segment_stats'][segment] = {
+                'count': int(row['count']),
+                'mean': float(row['mean']),
+                'median': float(row['median']),
+                'std': float(row['std']),
+                'min': float(row['min']),
+                'max': float(row['max']),
+                'q25': float(segment_quartiles.at[segment, 0.25]),
+                'q75': float(segment_quartiles.at[segment, 0.75])
+            }
         
         # Compare segments pairwise
-        segments_list = list(unique_segments)
+        segment_values = {segment: values.to_numpy() for segment, values in grouped}
+        segments_list = list(segment_values)
         for i, seg1 in enumerate(segments_list):
             for seg2 in segments_list[i+1:]:
-                seg1_data = df_filtered[df_filtered[segment_column] == seg1][metric_column].dropna()
-                seg2_data = df_filtered[df_filtered[segment_column] == seg2][metric_column].dropna()
+                seg1_data = segment_values[seg1]
+                seg2_data = segment_values[seg2]
+                seg1_mean = comparison['segment_stats'][seg1]['mean']
+                seg2_mean = comparison['segment_stats'][seg2]['mean']
                 
-                if len(seg1_data) > 0 and len(seg2_data) > 0:
-                    # Statistical test (t-test for means)
-                    try:
-                        t_stat, p_value = stats.ttest_ind(seg1_data, seg2_data)
-                        
-                        comparison['comparisons'][f"{seg1}_vs_{seg2}"] = {
-                            'mean_diff': float(seg1_data.mean() - seg2_data.mean()),
-                            'mean_diff_pct': float(((seg1_data.mean() - seg2_data.mean()) / seg2_data.mean() * 100) if seg2_data.mean() != 0 else 0),
-                            't_statistic': float(t_stat),
-                            'p_value': float(p_value),
-                            'significant': p_value < 0.05
-                        }
-                    except:
-                        pass
+                # Statistical test (t-test for means)
+                try:
+                    t_stat, p_value = stats.ttest_ind(seg1_data, seg2_data)
+                    
+                    comparison['comparisons'][f"{seg1}_vs_{seg2}"] = {
+                        'mean_diff': float(seg1_mean - seg2_mean),
+                        'mean_diff_pct': float(((seg1_mean - seg2_mean) / seg2_mean * 100) if seg2_mean != 0 else 0),
+                        't_statistic': float(t_stat),
+                        'p_value': float(p_value),
+                        'significant': p_value < 0.05
+                    }
+                except:
+                    pass
         
         return comparison
     
@@ -3,13 +3,139 @@ EDA (Exploratory Data Analysis) Module
 Performs EDA based on eda_rules.yml
 """
 
+import os
+import re
 import yaml
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import psycopg
+from psycopg import sql
 from datetime import datetime
-from scipy import stats
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# libyaml's C parser is much faster; fall back to pure Python if it's missing
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Optional: numba fuses the per-column distribution stats into one compiled pass
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Tables with more rows than this are sampled for the row-level phases
+# (distributions, relationships, time series); basic stats still cover
+# the full table via SQL aggregates
+EDA_SAMPLE_ROWS = 100_000
+
+# Rows converted to a DataFrame at a time when reading table data
+EDA_CHUNK_ROWS = 50_000
+
+# information_schema data types handled by the server-side basic stats
+_NUMERIC_TYPES = frozenset({'smallint', 'integer', 'bigint', 'numeric', 'real', 'double precision'})
+_DATE_TYPES = frozenset({'date', 'timestamp without time zone', 'timestamp with time zone'})
+# Every other column (text, uuid, boolean, enums, date, ...) is read into an
+# object column and summarized as categorical, server-side as well; these
+# are not, and JSON/XML have no ordering for count(DISTINCT)
+_NON_CATEGORICAL_TYPES = _NUMERIC_TYPES | frozenset({
+    'timestamp without time zone', 'timestamp with time zone', 'interval', 'json', 'jsonb', 'xml'
+})
+
+# Column names treated as dates for the date range and time-series phases
+_DATE_RE = re.compile(r'(?:date|time|created|occurred|timestamp)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _load_rules_cached(rules_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a rules file once per modification time
+    
+    The returned dict is shared by every analyzer using the file, so treat
+    it as read-only.
+    """
+    with open(rules_file, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    """Convert a pandas/NumPy scalar to float, mapping NaN to None"""
+    return None if pd.isna(value) else float(value)
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _linear_quantile(values, q):
+        """Quantile with linear interpolation (pandas' default) via quickselect"""
+        pos = q * (values.size - 1)
+        k = int(np.floor(pos))
+        part = np.partition(values, k)
+        lower = part[k]
+        if k + 1 >= values.size:
+            return lower
+        upper = part[k + 1:].min()
+        return lower + (pos - k) * (upper - lower)
+    
+    @numba.njit(parallel=True, cache=True)
+    def _column_distribution_stats(arr):
+        """
+        Per-column (count, skewness, outlier_count, zero_count) for a 2D
+        float array with NaN for nulls; columns are processed in parallel
+        """
+        n_cols = arr.shape[1]
+        out = np.zeros((n_cols, 4))
+        for j in numba.prange(n_cols):
+            col = arr[:, j]
+            values = col[~np.isnan(col)]
+            n = values.size
+            if n == 0:
+                continue
+            
+            # Biased sample skewness from central moments (scipy.stats.skew's default)
+            mean = values.sum() / n
+            m2 = 0.0
+            m3 = 0.0
+            zero_count = 0
+            for v in values:
+                d = v - mean
+                m2 += d * d
+                m3 += d * d * d
+                if v == 0:
+                    zero_count += 1
+            m2 /= n
+            m3 /= n
+            skewness = m3 / m2 ** 1.5 if m2 > 0 else np.nan
+            
+            # IQR outliers
+            q1 = _linear_quantile(values, 0.25)
+            q3 = _linear_quantile(values, 0.75)
+            iqr = q3 - q1
+            lower_bound = q1 - 1.5 * iqr
+            upper_bound = q3 + 1.5 * iqr
+            outlier_count = 0
+            for v in values:
+                if v < lower_bound or v > upper_bound:
+                    outlier_count += 1
+            
+            out[j, 0] = n
+            out[j, 1] = skewness
+            out[j, 2] = outlier_count
+            out[j, 3] = zero_count
+        return out
+else:
+    _column_distribution_stats = None
+
+
+def _eda_worker(table_name: str, dsn: str, rules_file: str,
+                sample_size: Optional[int]) -> Dict[str, Any]:
+    """Run EDA for one table on its own connection (process pool entry point)"""
+    with psycopg.connect(dsn) as connection:
+        analyzer = EDAAnalyzer(connection, rules_file)
+        return analyzer.run_eda(table_name, sample_size)
 
 
 class EDAAnalyzer:
@@ -19,14 +145,16 @@ class EDAAnalyzer:
     
     def __init__(self, connection, rules_file: str = "eda_rules.yml"):
         self.connection = connection
+        self.rules_file = rules_file
         self.rules = self._load_rules(rules_file)
         self.eda_results: List[Dict[str, Any]] = []
+        # Per-table column summaries shared between phases, reset by run_eda
+        self._cache: Dict[str, Any] = {}
         
     def _load_rules(self, rules_file: str) -> Dict[str, Any]:
         """Load EDA rules from YAML file"""
         try:
-            with open(rules_file, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_rules_cached(rules_file, os.stat(rules_file).st_mtime_ns)
         except FileNotFoundError:
             print(f"Warning: {rules_file} not found. Using default rules.")
             return {}
@@ -40,14 +168,18 @@ class EDAAnalyzer:
         
         Args:
             table_name: Name of the table to analyze
-            sample_size: Optional sample size for large tables
+            sample_size: Optional sample size for large tables. When omitted,
+                basic stats are aggregated in the database over the full table
+                and tables above EDA_SAMPLE_ROWS are sampled for the other phases
         
         Returns:
             Dictionary with EDA results
         """
+        # One clock reading for the result timestamp and data recency checks
+        now = datetime.now()
         results = {
             'table_name': table_name,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'basic_stats': {},
             'distribution_analysis': {},
             'relationship_analysis': {},
@@ -56,30 +188,71 @@ class EDAAnalyzer:
             'typical_questions': []
         }
         
+        basic_stats_enabled = self.rules.get('eda_phases', {}).get('basic_stats', {}).get('enabled', True)
+        
         # Get table data
-        limit_clause = f"LIMIT {sample_size}" if sample_size else ""
-        query = f"SELECT * FROM {table_name} {limit_clause};"
-        df = pd.read_sql_query(query, self.connection)
+        server_stats = None
+        if sample_size:
+            query = f"SELECT * FROM {table_name} LIMIT {sample_size};"
+            df = self._read_rows(query)
+        else:
+            # Aggregate the full table in the database and only pull a bounded
+            # sample of rows for the phases that need row-level data
+            if basic_stats_enabled:
+                server_stats = self._server_side_basic_stats(table_name)
+            df = self._fetch_rows(table_name, server_stats['row_count'] if server_stats else None)
+            results['sampled_rows'] = len(df)
+        # Full table size when df is only a sample of it
+        table_rows = server_stats['row_count'] if server_stats and server_stats['row_count'] > len(df) else None
         
         if df.empty:
             return results
         
+        # Null counts and value counts are reused by the basic stats and
+        # distribution phases
+        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        self._cache = {
+            'null_counts': df.isnull().sum(),
+            'value_counts': {col: df[col].value_counts() for col in categorical_cols}
+        }
+        
+        # Parse date columns once into a side dict that basic stats and time
+        # series share; df itself is left unchanged. Numeric columns whose
+        # names merely look date-like (e.g. response_time_ms) are skipped, as
+        # are columns that can't be parsed (e.g. mixed timezones)
+        date_series = {}
+        for col in df.columns:
+            if _DATE_RE.search(col) and not pd.api.types.is_numeric_dtype(df[col]):
+                try:
+                    date_series[col] = pd.to_datetime(df[col], errors='coerce')
+                except (TypeError, ValueError):
+                    continue
+        
         # Run basic stats
-        if self.rules.get('eda_phases', {}).get('basic_stats', {}).get('enabled', True):
-            results['basic_stats'] = self._calculate_basic_stats(df, table_name)
+        if server_stats is not None:
+            # Top values come from the fetched rows; everything else is exact.
+            # Columns without NULLs in the rows (e.g. boolean) aren't object
+            # dtype there, so aren't in the value counts cache
+            for col, summary in server_stats['categorical_summary'].items():
+                value_counts = self._cache['value_counts'].get(col)
+                if value_counts is None:
+                    value_counts = df[col].value_counts()
+                summary['top_values'] = value_counts.head(10).to_dict()
+            results['basic_stats'] = server_stats
+        elif basic_stats_enabled:
+            results['basic_stats'] = self._calculate_basic_stats(df, table_name, date_series)
         
         # Run distribution analysis
         if self.rules.get('eda_phases', {}).get('distribution_analysis', {}).get('enabled', True):
-            results['distribution_analysis'] = self._analyze_distributions(df)
+            results['distribution_analysis'] = self._analyze_distributions(df, table_rows)
         
         # Run relationship analysis
         if self.rules.get('eda_phases', {}).get('relationship_analysis', {}).get('enabled', True):
             results['relationship_analysis'] = self._analyze_relationships(df)
         
         # Check if time-series
-        date_columns = [col for col in df.columns if any(date_word in col.lower() for date_word in ['date', 'time', 'created', 'occurred', 'timestamp'])]
-        if date_columns and self.rules.get('eda_phases', {}).get('time_series_analysis', {}).get('enabled', True):
-            results['time_series_analysis'] = self._analyze_time_series(df, date_columns[0])
+        if date_series and self.rules.get('eda_phases', {}).get('time_series_analysis', {}).get('enabled', True):
+            results['time_series_analysis'] = self._analyze_time_series(next(iter(date_series.values())), now)
         
         # Generate flags and typical questions
         results['flags'] = self._generate_flags(results)
@@ -88,7 +261,190 @@ class EDAAnalyzer:
         self.eda_results.append(results)
         return results
     
-    def _calculate_basic_stats(self, df: pd.DataFrame, table_name: str) -> Dict[str, Any]:
+    def run_eda_many(self, table_names: List[str], dsn: str,
+                     workers: Optional[int] = None,
+                     sample_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run EDA on several tables in parallel, one process per table
+        
+        Each worker opens its own connection from dsn, so the pandas work
+        for different tables runs on separate cores.
+        
+        Args:
+            table_names: Tables to analyze
+            dsn: Connection string passed to psycopg.connect in each worker
+            workers: Maximum worker processes (defaults to os.cpu_count())
+            sample_size: Optional sample size, as in run_eda
+        
+        Returns:
+            EDA results in the same order as table_names
+        """
+        if len(table_names) <= 1:
+            return [self.run_eda(table_name, sample_size) for table_name in table_names]
+        
+        workers = min(workers or os.cpu_count() or 1, len(table_names))
+        results_by_table = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_eda_worker, table_name, dsn, self.rules_file, sample_size): table_name
+                for table_name in table_names
+            }
+            for future in as_completed(futures):
+                results_by_table[futures[future]] = future.result()
+        
+        results = [results_by_table[table_name] for table_name in table_names]
+        self.eda_results.extend(results)
+        return results
+    
+    def _fetch_rows(self, table_name: str, row_count: Optional[int]) -> pd.DataFrame:
+        """Fetch a table's rows, sampling tables larger than EDA_SAMPLE_ROWS"""
+        if row_count is None or row_count <= EDA_SAMPLE_ROWS:
+            return self._read_rows(f"SELECT * FROM {table_name};")
+        
+        percent = EDA_SAMPLE_ROWS * 100 / row_count
+        try:
+            # Savepoint, so a failure leaves the caller's transaction usable
+            with self.connection.transaction():
+                return self._read_rows(f"SELECT * FROM {table_name} TABLESAMPLE SYSTEM ({percent:.6f});")
+        except psycopg.Error:
+            # TABLESAMPLE only works on tables and materialized views
+            return self._read_rows(f"SELECT * FROM {table_name} LIMIT {EDA_SAMPLE_ROWS};")
+    
+    def _read_rows(self, query: str) -> pd.DataFrame:
+        """
+        Read query results in chunks and downcast integer columns once at the end
+        
+        Rows stream from a server-side cursor, so neither the client nor pandas
+        ever buffers the full result set as Python tuples. Dtypes are inferred
+        on the combined frame: a column that is entirely NULL in one chunk
+        would otherwise turn the whole column into object.
+        """
+        chunks = []
+        # DECLARE ... CURSOR FOR takes a single statement without terminator
+        with self.connection.cursor(name='eda_rows') as cur:
+            cur.itersize = EDA_CHUNK_ROWS
+            cur.execute(query.rstrip().rstrip(';'))
+            columns = [desc.name for desc in cur.description]
+            while True:
+                rows = cur.fetchmany(EDA_CHUNK_ROWS)
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame.from_records(rows, columns=columns, coerce_float=True))
+        
+        if not chunks:
+            return pd.DataFrame()
+        df = pd.concat(chunks, ignore_index=True).infer_objects() if len(chunks) > 1 else chunks[0]
+        int_cols = df.select_dtypes(include=['integer']).columns
+        if len(int_cols) > 0:
+            df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast='integer')
+        return df
+    
+    def _server_side_basic_stats(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Calculate basic statistics for the full table in one SQL aggregate query
+        
+        Returns the same structure as _calculate_basic_stats, with empty
+        top_values for the caller to fill from row-level data, or None if the
+        table's columns can't be introspected or the query fails.
+        """
+        # Schema-qualified names ("public.users") are looked up in that
+        # schema; bare names in the search path
+        schema_name, _, bare_name = table_name.rpartition('.')
+        try:
+            # Savepoint, so a failure leaves the caller's transaction usable
+            with self.connection.transaction(), self.connection.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT column_name, data_type
+                    FROM information_schema.columns
+                    WHERE table_name = %s
+                      AND table_schema = ANY(COALESCE(%s::name[], current_schemas(false)))
+                    ORDER BY ordinal_position
+                    """,
+                    (bare_name, [schema_name] if schema_name else None)
+                )
+                columns = cur.fetchall()
+                if not columns:
+                    return None
+                
+                select_items = [sql.SQL("count(*)")]
+                for col, data_type in columns:
+                    ident = sql.Identifier(col)
+                    select_items.append(sql.SQL("count({})").format(ident))
+                    if data_type in _NUMERIC_TYPES:
+                        select_items.extend(
+                            sql.SQL(template).format(ident) for template in (
+                                "avg({})::float8",
+                                "stddev_samp({})::float8",
+                                "min({})::float8",
+                                "max({})::float8",
+                                "percentile_cont(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY {}::float8)"
+                            )
+                        )
+                    if data_type not in _NON_CATEGORICAL_TYPES:
+                        select_items.append(sql.SQL("count(DISTINCT {})").format(ident))
+                    if data_type in _DATE_TYPES:
+                        select_items.append(sql.SQL("min({})").format(ident))
+                        select_items.append(sql.SQL("max({})").format(ident))
+                
+                cur.execute(sql.SQL("SELECT {} FROM {}").format(
+                    sql.SQL(', ').join(select_items), sql.SQL(table_name)
+                ))
+                values = iter(cur.fetchone())
+        except psycopg.Error as e:
+            print(f"Warning: server-side stats failed for {table_name}: {e}")
+            return None
+        
+        row_count = next(values)
+        stats_dict = {
+            'row_count': row_count,
+            'column_count': len(columns),
+            'columns': [col for col, _ in columns],
+            'numeric_summary': {},
+            'categorical_summary': {},
+            'null_summary': {}
+        }
+        
+        for col, data_type in columns:
+            null_count = row_count - next(values)
+            if null_count > 0:
+                stats_dict['null_summary'][col] = {
+                    'null_count': null_count,
+                    'null_percentage': null_count / row_count * 100
+                }
+            
+            if data_type in _NUMERIC_TYPES:
+                mean, std, min_value, max_value, quartiles = (next(values) for _ in range(5))
+                q25, median, q75 = quartiles or (None, None, None)
+                stats_dict['numeric_summary'][col] = {
+                    'count': row_count - null_count,
+                    'mean': mean,
+                    'median': median,
+                    'std': std,
+                    'min': min_value,
+                    'max': max_value,
+                    'q25': q25,
+                    'q75': q75
+                }
+            if data_type not in _NON_CATEGORICAL_TYPES:
+                stats_dict['categorical_summary'][col] = {
+                    'unique_count': next(values),
+                    'top_values': {},
+                    'null_count': null_count
+                }
+            if data_type in _DATE_TYPES:
+                first, last = next(values), next(values)
+                if first is not None:
+                    stats_dict.setdefault('date_range', {})[col] = {
+                        'min': str(first),
+                        'max': str(last),
+                        'span_days': (last - first).days
+                    }
+        
+        return stats_dict
+    
+    def _calculate_basic_stats(self, df: pd.DataFrame, table_name: str,
+                               date_series: Dict[str, pd.Series]) -> Dict[str, Any]:
         """Calculate basic descriptive statistics"""
         stats_dict = {
             'row_count': len(df),
@@ -100,7 +456,7 @@ class EDAAnalyzer:
         }
         
         # Null summary
-        null_counts = df.isnull().sum()
+        null_counts = self._cache['null_counts']
         null_pct = (null_counts / len(df)) * 100
         stats_dict['null_summary'] = {
             col: {
@@ -111,50 +467,56 @@ class EDAAnalyzer:
             if null_counts[col] > 0
         }
         
-        # Numeric summary
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            stats_dict['numeric_summary'][col] = {
-                'count': int(df[col].count()),
-                'mean': float(df[col].mean()) if not df[col].isna().all() else None,
-                'median': float(df[col].median()) if not df[col].isna().all() else None,
-                'std': float(df[col].std()) if not df[col].isna().all() else None,
-                'min': float(df[col].min()) if not df[col].isna().all() else None,
-                'max': float(df[col].max()) if not df[col].isna().all() else None,
-                'q25': float(df[col].quantile(0.25)) if not df[col].isna().all() else None,
-                'q75': float(df[col].quantile(0.75)) if not df[col].isna().all() else None
+        # Numeric summary; two multi-column reductions instead of per-column
+        # scalar calls. All-null columns come back as NaN, reported as None
+        numeric_df = df.select_dtypes(include=[np.number])
+        if len(numeric_df.columns) > 0:
+            summary = numeric_df.agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+            quartiles = numeric_df.quantile([0.25, 0.75])
+            stats_dict['numeric_summary'] = {
+                col: {
+                    'count': int(summary.at['count', col]),
+                    'mean': _float_or_none(summary.at['mean', col]),
+                    'median': _float_or_none(summary.at['median', col]),
+                    'std': _float_or_none(summary.at['std', col]),
+                    'min': _float_or_none(summary.at['min', col]),
+                    'max': _float_or_none(summary.at['max', col]),
+                    'q25': _float_or_none(quartiles.at[0.25, col]),
+                    'q75': _float_or_none(quartiles.at[0.75, col])
+                }
+                for col in numeric_df.columns
             }
         
         # Categorical summary
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-        for col in categorical_cols:
-            value_counts = df[col].value_counts().head(10)
+        for col, value_counts in self._cache['value_counts'].items():
             stats_dict['categorical_summary'][col] = {
-                'unique_count': int(df[col].nunique()),
-                'top_values': value_counts.to_dict(),
-                'null_count': int(df[col].isnull().sum())
+                'unique_count': len(value_counts),
+                'top_values': value_counts.head(10).to_dict(),
+                'null_count': int(null_counts[col])
             }
         
         # Date range
-        date_cols = [col for col in df.columns if any(word in col.lower() for word in ['date', 'time', 'created', 'occurred', 'timestamp'])]
-        for col in date_cols:
-            try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-                if df[col].notna().any():
-                    stats_dict['date_range'] = {
-                        col: {
-                            'min': str(df[col].min()),
-                            'max': str(df[col].max()),
-                            'span_days': (df[col].max() - df[col].min()).days if df[col].notna().any() else None
-                        }
-                    }
-            except:
-                pass
+        for col, dates in date_series.items():
+            if dates.notna().any():
+                first, last = dates.min(), dates.max()
+                stats_dict.setdefault('date_range', {})[col] = {
+                    'min': str(first),
+                    'max': str(last),
+                    'span_days': (last - first).days
+                }
         
         return stats_dict
     
-    def _analyze_distributions(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze data distributions"""
+    def _analyze_distributions(self, df: pd.DataFrame, table_rows: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze data distributions
+        
+        Args:
+            df: Table rows, or a sample of them
+            table_rows: Full table row count when df is a sample; outlier and
+                zero counts are then scaled up to the table and marked as
+                estimates, matching the full-table row_count in basic stats
+        """
         distribution_info = {
             'numeric_distributions': {},
             'categorical_distributions': {},
@@ -162,36 +524,26 @@ class EDAAnalyzer:
         }
         
         # Numeric distributions
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            if df[col].notna().sum() == 0:
+        numeric_df = df.select_dtypes(include=[np.number])
+        numeric_stats = self._numeric_distribution_stats(numeric_df)
+        scale = table_rows / len(df) if table_rows else None
+        for col, (count, skewness, outlier_count, zero_count) in zip(numeric_df.columns, numeric_stats):
+            if count == 0:
                 continue
-                
-            col_data = df[col].dropna()
-            if len(col_data) == 0:
-                continue
-            
-            # Calculate skewness
-            skewness = float(stats.skew(col_data))
-            
-            # Calculate outliers (IQR method)
-            Q1 = col_data.quantile(0.25)
-            Q3 = col_data.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers = col_data[(col_data < lower_bound) | (col_data > upper_bound)]
             
             # Zero inflation
-            zero_count = (col_data == 0).sum()
-            zero_pct = (zero_count / len(col_data)) * 100
+            zero_pct = (zero_count / count) * 100
+            outlier_pct = (outlier_count / count) * 100
+            if scale is not None:
+                outlier_count, zero_count = round(outlier_count * scale), round(zero_count * scale)
             
             distribution_info['numeric_distributions'][col] = {
                 'skewness': skewness,
-                'outlier_count': int(len(outliers)),
-                'outlier_percentage': float((len(outliers) / len(col_data)) * 100),
-                'zero_count': int(zero_count),
-                'zero_percentage': float(zero_pct)
+                'outlier_count': outlier_count,
+                'outlier_percentage': float(outlier_pct),
+                'zero_count': zero_count,
+                'zero_percentage': float(zero_pct),
+                'estimated_from_sample': scale is not None
             }
             
             # Generate flags
@@ -203,12 +555,15 @@ class EDAAnalyzer:
                     'message': f"Highly skewed distribution detected in '{col}' (skewness: {skewness:.2f})"
                 })
             
-            if len(outliers) > 0:
+            if outlier_count > 0:
                 distribution_info['flags'].append({
                     'type': 'outliers',
                     'column': col,
-                    'count': int(len(outliers)),
-                    'message': f"Potential outliers detected in '{col}' ({len(outliers)} values)"
+                    'count': outlier_count,
+                    'message': (
+                        f"Potential outliers detected in '{col}' "
+                        f"({'~' if scale is not None else ''}{outlier_count} values)"
+                    )
                 })
             
             if zero_pct > 50:
@@ -221,10 +576,11 @@ class EDAAnalyzer:
         
         # Categorical distributions
         categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        null_counts = self._cache['null_counts']
         for col in categorical_cols:
-            unique_count = df[col].nunique()
-            total_count = df[col].count()
-            value_counts = df[col].value_counts()
+            value_counts = self._cache['value_counts'][col]
+            unique_count = len(value_counts)
+            total_count = len(df) - null_counts[col]
             max_class_pct = (value_counts.iloc[0] / total_count * 100) if total_count > 0 else 0
             
             distribution_info['categorical_distributions'][col] = {
@@ -252,6 +608,50 @@ class EDAAnalyzer:
         
         return distribution_info
     
+    def _numeric_distribution_stats(self, numeric_df: pd.DataFrame) -> List[Tuple[int, float, int, int]]:
+        """
+        (non-null count, skewness, IQR outlier count, zero count) per numeric column
+        
+        Uses the compiled single-pass kernel when numba is installed, otherwise
+        computes each column with NumPy.
+        """
+        if _column_distribution_stats is not None and len(numeric_df.columns) > 0:
+            arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+            return [
+                (int(count), float(skewness), int(outlier_count), int(zero_count))
+                for count, skewness, outlier_count, zero_count in _column_distribution_stats(arr)
+            ]
+        
+        quartile_q = np.array([0.25, 0.75])
+        column_stats = []
+        for col in numeric_df.columns:
+            values = numeric_df[col].dropna().to_numpy(dtype=np.float64)
+            n = values.size
+            if n == 0:
+                column_stats.append((0, float('nan'), 0, 0))
+                continue
+            
+            # Calculate skewness; biased central moments, as in the compiled kernel
+            deviations = values - values.mean()
+            m2 = np.dot(deviations, deviations) / n
+            m3 = np.dot(deviations * deviations, deviations) / n
+            skewness = float(m3 / m2 ** 1.5) if m2 > 0 else float('nan')
+            
+            # Calculate outliers (IQR method). Quartiles use quickselect with
+            # pandas' linear interpolation instead of a full sort per quantile
+            pos = quartile_q * (n - 1)
+            lower = pos.astype(np.intp)
+            upper = np.minimum(lower + 1, n - 1)
+            part = np.partition(values, np.union1d(lower, upper))
+            Q1, Q3 = part[lower] + (pos - lower) * (part[upper] - part[lower])
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+            outlier_count = int(np.count_nonzero((values < lower_bound) | (values > upper_bound)))
+            
+            column_stats.append((n, skewness, outlier_count, int(np.count_nonzero(values == 0))))
+        return column_stats
+    
     def _analyze_relationships(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze relationships between columns"""
         relationship_info = {
@@ -262,30 +662,43 @@ class EDAAnalyzer:
         # Calculate correlations for numeric columns
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) > 1:
-            corr_matrix = df[numeric_cols].corr()
+            arr = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            if not np.isnan(arr).any():
+                # No nulls, so pairwise-complete correlation equals the plain
+                # BLAS-backed one over the whole array
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr_matrix = np.corrcoef(arr, rowvar=False)
+            else:
+                corr_matrix = df[numeric_cols].corr().to_numpy()
+            
+            # Read the upper triangle in one gather rather than a .loc per pair
+            cols = np.asarray(numeric_cols, dtype=object)
+            i_idx, j_idx = np.triu_indices(len(cols), k=1)
+            values = corr_matrix[i_idx, j_idx]
+            valid = ~np.isnan(values)
+            
+            pairs = zip(cols[i_idx[valid]].tolist(), cols[j_idx[valid]].tolist(), values[valid].tolist())
+            for col1, col2, corr_value in pairs:
+                relationship_info['correlations'][f"{col1}_{col2}"] = {
+                    'column1': col1,
+                    'column2': col2,
+                    'correlation': corr_value
+                }
             
             # Find high correlations
-            for i, col1 in enumerate(numeric_cols):
-                for col2 in numeric_cols[i+1:]:
-                    corr_value = corr_matrix.loc[col1, col2]
-                    if not np.isnan(corr_value):
-                        relationship_info['correlations'][f"{col1}_{col2}"] = {
-                            'column1': col1,
-                            'column2': col2,
-                            'correlation': float(corr_value)
-                        }
-                        
-                        if abs(corr_value) > 0.7:
-                            relationship_info['flags'].append({
-                                'type': 'high_correlation',
-                                'columns': [col1, col2],
-                                'correlation': float(corr_value),
-                                'message': f"High correlation between '{col1}' and '{col2}' ({corr_value:.2f})"
-                            })
+            high = valid & (np.abs(values) > 0.7)
+            high_pairs = zip(cols[i_idx[high]].tolist(), cols[j_idx[high]].tolist(), values[high].tolist())
+            for col1, col2, corr_value in high_pairs:
+                relationship_info['flags'].append({
+                    'type': 'high_correlation',
+                    'columns': [col1, col2],
+                    'correlation': corr_value,
+                    'message': f"High correlation between '{col1}' and '{col2}' ({corr_value:.2f})"
+                })
         
         return relationship_info
     
-    def _analyze_time_series(self, df: pd.DataFrame, date_column: str) -> Dict[str, Any]:
+    def _analyze_time_series(self, dates: pd.Series, now: datetime) -> Dict[str, Any]:
         """Analyze time-series patterns"""
         ts_info = {
             'temporal_coverage': {},
@@ -293,20 +706,20 @@ class EDAAnalyzer:
         }
         
         try:
-            df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
-            df_sorted = df.sort_values(date_column)
+            # Parsed once by run_eda
+            dates = dates.sort_values()
             
-            if df_sorted[date_column].notna().any():
+            if dates.notna().any():
                 # Check for gaps
-                date_diff = df_sorted[date_column].diff()
-                max_gap_days = date_diff.max().days if hasattr(date_diff.max(), 'days') else 0
+                max_diff = dates.diff().max()
+                max_gap_days = max_diff.days if hasattr(max_diff, 'days') else 0
                 
                 # Check recent data
-                last_date = df_sorted[date_column].max()
-                days_since_last = (datetime.now() - last_date).days if isinstance(last_date, datetime) else None
+                last_date = dates.max()
+                days_since_last = (now - last_date).days if isinstance(last_date, datetime) else None
                 
                 ts_info['temporal_coverage'] = {
-                    'first_date': str(df_sorted[date_column].min()),
+                    'first_date': str(dates.min()),
                     'last_date': str(last_date),
                     'max_gap_days': int(max_gap_days),
                     'days_since_last': int(days_since_last) if days_since_last else None
@@ -333,21 +746,11 @@ class EDAAnalyzer:
     
     def _generate_flags(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate flags from EDA results"""
-        flags = []
-        
-        # Collect flags from distribution analysis
-        if 'distribution_analysis' in results and 'flags' in results['distribution_analysis']:
-            flags.extend(results['distribution_analysis']['flags'])
-        
-        # Collect flags from relationship analysis
-        if 'relationship_analysis' in results and 'flags' in results['relationship_analysis']:
-            flags.extend(results['relationship_analysis']['flags'])
-        
-        # Collect flags from time series analysis
-        if 'time_series_analysis' in results and 'flags' in results['time_series_analysis']:
-            flags.extend(results['time_series_analysis']['flags'])
-        
-        return flags
+        # Distribution, relationship, then time series flags, in one copy
+        return list(chain.from_iterable(
+            results.get(phase, {}).get('flags', ())
+            for phase in ('distribution_analysis', 'relationship_analysis', 'time_series_analysis')
+        ))
     
     def _generate_typical_questions(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate typical questions based on EDA results"""
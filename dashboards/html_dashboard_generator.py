@@ -3,258 +3,195 @@ HTML Dashboard Generator
 Creates static HTML dashboard mockups from analysis results
 """
 
-from typing import Dict, List, Any, Optional
+from typing import IO, Callable, Dict, List, Any, Optional, Union
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+import io
 import json
 from datetime import datetime
 import base64
+import gzip
+import math
+import os
+import numpy as np
+import pandas as pd
+from functools import lru_cache
 
+# Optional: orjson serializes chart data several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class HTMLDashboardGenerator:
-    """
-    Generates interactive HTML dashboards from analysis results
-    Creates standalone HTML files that can be opened in any browser
+
+# Dashboard items. __slots__ keeps instances small and attribute access fast;
+# it is declared by hand (not dataclass(slots=True)) to keep Python 3.8 support,
+# so fields carry no defaults here - the add_* methods supply them.
+@dataclass
+class Metric:
+    """A metric card"""
+    __slots__ = ('label', 'value', 'format', 'change', 'change_label')
+    label: str
+    value: Any
+    format: str  # 'number', 'currency', 'percentage'
+    change: Optional[float]
+    change_label: str
+
+
+@dataclass
+class Chart:
+    """A Chart.js chart"""
+    __slots__ = ('type', 'data', 'title', 'x_column', 'y_column', 'color_column')
+    type: str
+    data: Union[List[Dict], pd.DataFrame]
+    title: str
+    x_column: str
+    y_column: str
+    color_column: Optional[str]
+
+
+@dataclass
+class Table:
+    """A data table"""
+    __slots__ = ('title', 'data', 'columns')
+    title: str
+    data: Union[List[Dict], pd.DataFrame]
+    columns: List[str]
+
+
+def _finite_or_none(obj: Any) -> Any:
+    """Replace NaN/Infinity floats in nested lists/dicts with None"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
+def _dumps(obj: Any) -> str:
     """
+    Serialize chart/table data to a strict JSON string
     
-    def __init__(self):
-        self.charts = []
-        self.metrics = []
-        self.tables = []
-        self.title = "Analysis Dashboard"
-        self.description = ""
-        
-    def add_metric(self, label: str, value: Any, format: str = "number", 
-                   change: Optional[float] = None, change_label: str = ""):
-        """Add a metric card to the dashboard"""
-        self.metrics.append({
-            'label': label,
-            'value': value,
-            'format': format,  # 'number', 'currency', 'percentage'
-            'change': change,
-            'change_label': change_label
-        })
-    
-    def add_chart(self, chart_type: str, data: List[Dict], title: str, 
-                  x_column: str, y_column: str, color_column: Optional[str] = None):
-        """
-        Add a chart to the dashboard
-        
-        Args:
-            chart_type: 'bar', 'line', 'pie', 'scatter'
-            data: List of dictionaries with chart data
-            title: Chart title
-            x_column: Column name for x-axis
-            y_column: Column name for y-axis
-            color_column: Optional column for color coding
-        """
-        self.charts.append({
-            'type': chart_type,
-            'data': data,
-            'title': title,
-            'x_column': x_column,
-            'y_column': y_column,
-            'color_column': color_column
-        })
-    
-    def add_table(self, data: List[Dict], title: str, columns: Optional[List[str]] = None):
-        """Add a data table to the dashboard"""
-        if columns is None and data:
-            columns = list(data[0].keys())
-        
-        self.tables.append({
-            'title': title,
-            'data': data,
-            'columns': columns or []
-        })
+    NaN and Infinity become null with either backend, so the output is
+    always valid for JSON.parse; orjson does this natively.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
+    try:
+        return json.dumps(obj, default=str, allow_nan=False, separators=(',', ':'))
+    except ValueError:
+        # Only walk the data when it actually holds non-finite floats
+        return json.dumps(_finite_or_none(obj), default=str, allow_nan=False, separators=(',', ':'))
+
+
+# typed=True keeps 1, 1.0 and True apart; they format differently as text
+@lru_cache(maxsize=4096, typed=True)
+def _format_value(value: Any, format_type: str) -> str:
+    """Format a metric value based on format type"""
+    if value is None:
+        return "N/A"
     
-    def format_value(self, value: Any, format_type: str) -> str:
-        """Format value based on format type"""
-        if value is None:
-            return "N/A"
-        
-        if format_type == "currency":
-            return f"${float(value):,.2f}"
-        elif format_type == "percentage":
-            return f"{float(value):.2f}%"
-        elif format_type == "number":
-            if isinstance(value, (int, float)):
-                return f"{value:,.0f}" if value == int(value) else f"{value:,.2f}"
-            return str(value)
-        else:
-            return str(value)
+    if format_type == "currency":
+        return f"${float(value):,.2f}"
+    elif format_type == "percentage":
+        return f"{float(value):.2f}%"
+    elif format_type == "number":
+        if isinstance(value, (int, float)):
+            if isinstance(value, float) and not math.isfinite(value):
+                return "N/A"
+            return f"{value:,.0f}" if value == int(value) else f"{value:,.2f}"
+        return str(value)
+    else:
+        return str(value)
+
+
+def _column_values(series: pd.Series) -> Any:
+    """A DataFrame column as a JSON-serializable sequence"""
+    # orjson writes numeric numpy buffers directly; anything else goes via lists.
+    # It only accepts C-contiguous arrays (others would fall through to
+    # default=str and come out as a string), so strided views are copied
+    if orjson is not None and series.dtype.kind in 'biuf':
+        return np.ascontiguousarray(series.to_numpy())
+    return series.tolist()
+
+
+def _chart_columns(chart: Chart) -> Dict[str, Any]:
+    """
+    Plotted values for the page's data blob, as parallel x/y arrays
     
-    def generate_chart_js(self, chart: Dict) -> str:
-        """Generate Chart.js code for a chart"""
-        chart_id = f"chart_{len(self.charts)}"
-        data_json = json.dumps(chart['data'])
-        
-        if chart['type'] == 'bar':
-            return f"""
-            <canvas id="{chart_id}"></canvas>
-            <script>
-                const ctx_{chart_id} = document.getElementById('{chart_id}').getContext('2d');
-                const data_{chart_id} = {data_json};
-                new Chart(ctx_{chart_id}, {{
-                    type: 'bar',
-                    data: {{
-                        labels: data_{chart_id}.map(d => d['{chart['x_column']}']),
-                        datasets: [{{
-                            label: '{chart['y_column']}',
-                            data: data_{chart_id}.map(d => d['{chart['y_column']}']),
-                            backgroundColor: 'rgba(54, 162, 235, 0.6)',
-                            borderColor: 'rgba(54, 162, 235, 1)',
-                            borderWidth: 1
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        plugins: {{
-                            title: {{
-                                display: true,
-                                text: '{chart['title']}'
-                            }}
-                        }}
-                    }}
-                }});
-            </script>
-            """
-        
-        elif chart['type'] == 'line':
-            return f"""
-            <canvas id="{chart_id}"></canvas>
-            <script>
-                const ctx_{chart_id} = document.getElementById('{chart_id}').getContext('2d');
-                const data_{chart_id} = {data_json};
-                new Chart(ctx_{chart_id}, {{
-                    type: 'line',
-                    data: {{
-                        labels: data_{chart_id}.map(d => d['{chart['x_column']}']),
-                        datasets: [{{
-                            label: '{chart['y_column']}',
-                            data: data_{chart_id}.map(d => d['{chart['y_column']}']),
-                            borderColor: 'rgba(75, 192, 192, 1)',
-                            backgroundColor: 'rgba(75, 192, 192, 0.2)',
-                            tension: 0.1
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        plugins: {{
-                            title: {{
-                                display: true,
-                                text: '{chart['title']}'
-                            }}
-                        }}
-                    }}
-                }});
-            </script>
-            """
-        
-        elif chart['type'] == 'pie':
-            return f"""
-            <canvas id="{chart_id}"></canvas>
-            <script>
-                const ctx_{chart_id} = document.getElementById('{chart_id}').getContext('2d');
-                const data_{chart_id} = {data_json};
-                new Chart(ctx_{chart_id}, {{
-                    type: 'pie',
-                    data: {{
-                        labels: data_{chart_id}.map(d => d['{chart['x_column']}']),
-                        datasets: [{{
-                            data: data_{chart_id}.map(d => d['{chart['y_column']}']),
-                            backgroundColor: [
-                                'rgba(255, 99, 132, 0.6)',
-                                'rgba(54, 162, 235, 0.6)',
-                                'rgba(255, 206, 86, 0.6)',
-                                'rgba(75, 192, 192, 0.6)',
-                                'rgba(153, 102, 255, 0.6)',
-                                'rgba(255, 159, 64, 0.6)'
-                            ]
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        plugins: {{
-                            title: {{
-                                display: true,
-                                text: '{chart['title']}'
-                            }}
-                        }}
-                    }}
-                }});
-            </script>
-            """
-        
-        return ""
+    Column arrays avoid repeating key names in every row and map straight
+    onto Chart.js labels/data without per-row extraction in the browser.
+    """
+    data, x_column, y_column = chart.data, chart.x_column, chart.y_column
+    if isinstance(data, pd.DataFrame):
+        return {'x': _column_values(data[x_column]), 'y': _column_values(data[y_column])}
+    return {
+        'x': [row.get(x_column) for row in data],
+        'y': [row.get(y_column) for row in data]
+    }
+
+
+def _chart_id(index: int) -> str:
+    """DOM id for a chart, from its position on the page"""
+    return f"chart_{index}"
+
+
+# One-pass translation table for text placed in HTML element content/attributes
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+
+def _escape(value: Any) -> str:
+    """HTML-escape a value's text"""
+    return str(value).translate(_HTML_ESCAPE)
+
+
+def _js_string(value: Any) -> str:
+    """
+    A value's text as a JavaScript string literal, quotes included
     
-    def generate_html(self) -> str:
-        """Generate complete HTML dashboard"""
-        
-        # Generate metrics HTML
-        metrics_html = ""
-        if self.metrics:
-            metrics_html = '<div class="metrics-grid">'
-            for metric in self.metrics:
-                change_html = ""
-                if metric['change'] is not None:
-                    change_class = "positive" if metric['change'] >= 0 else "negative"
-                    change_html = f'<div class="change {change_class}">{metric["change_label"]} {abs(metric["change"]):.1f}%</div>'
-                
-                metrics_html += f"""
-                <div class="metric-card">
-                    <div class="metric-label">{metric['label']}</div>
-                    <div class="metric-value">{self.format_value(metric['value'], metric['format'])}</div>
-                    {change_html}
-                </div>
-                """
-            metrics_html += '</div>'
-        
-        # Generate charts HTML
-        charts_html = ""
-        for i, chart in enumerate(self.charts):
-            charts_html += f'<div class="chart-container"><div class="chart-wrapper">{self.generate_chart_js(chart)}</div></div>'
-        
-        # Generate tables HTML
-        tables_html = ""
-        for table in self.tables:
-            # Build table header
-            header_html = '<thead><tr>'
-            for col in table['columns']:
-                header_html += f'<th>{col}</th>'
-            header_html += '</tr></thead>'
-            
-            # Build table body
-            body_html = '<tbody>'
-            for row in table['data']:
-                body_html += '<tr>'
-                for col in table['columns']:
-                    value = row.get(col, '')
-                    # Format numeric values
-                    if isinstance(value, (int, float)):
-                        if value == int(value):
-                            value = f"{int(value):,}"
-                        else:
-                            value = f"{value:,.2f}"
-                    body_html += f'<td>{value}</td>'
-                body_html += '</tr>'
-            body_html += '</tbody>'
-            
-            tables_html += f"""
-            <div class="table-container">
-                <h3>{table['title']}</h3>
-                <table class="data-table">
-                    {header_html}
-                    {body_html}
-                </table>
-            </div>
-            """
-        
-        html_template = f"""
-<!DOCTYPE html>
+    Safe inside an inline <script>: "<" is escaped so the text can't close
+    the element early.
+    """
+    return json.dumps(str(value)).replace('<', '\\u003c')
+
+
+def _format_number_cell(value: Any) -> str:
+    """Format a numeric table cell with thousands separators"""
+    if isinstance(value, (int, float)):
+        # Missing values (NaN) and infinities get an empty cell
+        if isinstance(value, float) and not math.isfinite(value):
+            return ""
+        if value == int(value):
+            return f"{int(value):,}"
+        return f"{value:,.2f}"
+    return _escape(value)
+
+
+def _pick_cell_formatter(rows: List[Dict], column: str) -> Callable[[Any], str]:
+    """Choose a column's cell formatter from its first non-null value"""
+    sample = next((row[column] for row in rows if row.get(column) is not None), None)
+    if isinstance(sample, (int, float)):
+        return _format_number_cell
+    return _escape
+
+
+# Page shell; CSS braces are doubled for str.format_map on the head
+_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.title}</title>
+    <title>{title}</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <style>
         * {{
@@ -392,58 +329,312 @@ class HTMLDashboardGenerator:
 </head>
 <body>
     <div class="dashboard-header">
-        <h1>{self.title}</h1>
-        <p>{self.description or "Generated from analysis results"}</p>
-        <p style="margin-top: 10px; font-size: 14px; color: #999;">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <h1>{title}</h1>
+        <p>{description}</p>
+        <p style="margin-top: 10px; font-size: 14px; color: #999;">Generated: {timestamp}</p>
     </div>
     
-    {metrics_html}
-    
-    {charts_html}
-    
-    {tables_html}
+    {sections}
     
     <div class="footer">
         <p>Dashboard generated by Analysis Framework</p>
     </div>
 </body>
 </html>
+"""
+
+# Split around the body so generate_html can stream sections between the two
+_PAGE_HEAD, _PAGE_TAIL = _TEMPLATE.split('{sections}')
+
+
+# Chart.js snippet shared by every chart type; braces are doubled for str.format_map
+_CHART_TEMPLATE = """
+            <canvas id="{chart_id}"></canvas>
+            <script>
+                const ctx_{chart_id} = document.getElementById('{chart_id}').getContext('2d');
+                const data_{chart_id} = window.__dashData['{chart_id}'];
+                new Chart(ctx_{chart_id}, {{
+                    type: '{chart_type}',
+                    data: {{
+                        labels: data_{chart_id}.x,
+                        datasets: [{{{dataset_label}
+                            data: data_{chart_id}.y,
+                            {dataset_style}
+                        }}]
+                    }},
+                    options: {{
+                        responsive: true,
+                        plugins: {{
+                            title: {{
+                                display: true,
+                                text: {title}
+                            }}
+                        }}
+                    }}
+                }});
+            </script>
+            """
+
+# Per-type dataset styling; label controls whether the dataset is named
+_CHART_STYLE = {
+    'bar': {
+        'label': True,
+        'dataset': """backgroundColor: 'rgba(54, 162, 235, 0.6)',
+                            borderColor: 'rgba(54, 162, 235, 1)',
+                            borderWidth: 1"""
+    },
+    'line': {
+        'label': True,
+        'dataset': """borderColor: 'rgba(75, 192, 192, 1)',
+                            backgroundColor: 'rgba(75, 192, 192, 0.2)',
+                            tension: 0.1"""
+    },
+    'pie': {
+        'label': False,
+        'dataset': """backgroundColor: [
+                                'rgba(255, 99, 132, 0.6)',
+                                'rgba(54, 162, 235, 0.6)',
+                                'rgba(255, 206, 86, 0.6)',
+                                'rgba(75, 192, 192, 0.6)',
+                                'rgba(153, 102, 255, 0.6)',
+                                'rgba(255, 159, 64, 0.6)'
+                            ]"""
+    }
+}
+
+
+class HTMLDashboardGenerator:
+    """
+    Generates interactive HTML dashboards from analysis results
+    Creates standalone HTML files that can be opened in any browser
+    """
+    
+    def __init__(self):
+        self.charts: List[Chart] = []
+        self.metrics: List[Metric] = []
+        self.tables: List[Table] = []
+        self.title = "Analysis Dashboard"
+        self.description = ""
+        # Header timestamp, formatted on first render and reused afterwards
+        self._timestamp: Optional[str] = None
+        
+    def add_metric(self, label: str, value: Any, format: str = "number", 
+                   change: Optional[float] = None, change_label: str = ""):
+        """Add a metric card to the dashboard"""
+        self.metrics.append(Metric(label, value, format, change, change_label))
+    
+    def add_chart(self, chart_type: str, data: Union[List[Dict], pd.DataFrame], title: str, 
+                  x_column: str, y_column: str, color_column: Optional[str] = None):
         """
+        Add a chart to the dashboard
         
-        return html_template
+        Args:
+            chart_type: 'bar', 'line', 'pie', 'scatter'
+            data: List of dictionaries or a DataFrame with chart data; DataFrames
+                are kept as-is until the dashboard is rendered
+            title: Chart title
+            x_column: Column name for x-axis
+            y_column: Column name for y-axis
+            color_column: Optional column for color coding
+        """
+        self.charts.append(Chart(chart_type, data, title, x_column, y_column, color_column))
+    
+    def add_table(self, data: Union[List[Dict], pd.DataFrame], title: str,
+                  columns: Optional[List[str]] = None):
+        """Add a data table (list of dictionaries or DataFrame) to the dashboard"""
+        if columns is None:
+            if isinstance(data, pd.DataFrame):
+                columns = list(data.columns)
+            elif data:
+                columns = list(data[0].keys())
+        
+        self.tables.append(Table(title, data, columns or []))
     
-    def save_dashboard(self, filepath: str):
-        """Save dashboard to HTML file"""
-        html_content = self.generate_html()
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    def format_value(self, value: Any, format_type: str) -> str:
+        """Format value based on format type"""
+        try:
+            return _format_value(value, format_type)
+        except TypeError:
+            # Unhashable values can't be cached
+            return _format_value.__wrapped__(value, format_type)
+    
+    def generate_chart_js(self, chart: Chart, index: Optional[int] = None) -> str:
+        """
+        Generate Chart.js code for a chart
+        
+        The snippet reads its data from the page's shared dashboard-data blob
+        (see generate_html) under _chart_id(index); index defaults to the
+        chart's position in self.charts.
+        """
+        if index is None:
+            index = next((i for i, c in enumerate(self.charts) if c is chart), len(self.charts))
+        chart_id = _chart_id(index)
+        chart_type = chart.type
+        style = _CHART_STYLE.get(chart_type)
+        if style is None:
+            return ""
+        
+        return _CHART_TEMPLATE.format_map({
+            'chart_id': chart_id,
+            'chart_type': chart_type,
+            'title': _js_string(chart.title),
+            'dataset_label': f"\n                            label: {_js_string(chart.y_column)}," if style['label'] else "",
+            'dataset_style': style['dataset']
+        })
+    
+    def generate_html(self, out: Optional[IO[str]] = None) -> Optional[str]:
+        """
+        Generate complete HTML dashboard
+        
+        Args:
+            out: Optional text stream to write the HTML to as it is produced.
+                When omitted the HTML is returned as a string.
+        """
+        if out is None:
+            buf = io.StringIO()
+            self.generate_html(out=buf)
+            return buf.getvalue()
+        
+        if self._timestamp is None:
+            self._timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        write = out.write
+        write(_PAGE_HEAD.format_map({
+            'title': _escape(self.title),
+            'description': _escape(self.description or "Generated from analysis results"),
+            'timestamp': self._timestamp
+        }))
+        
+        # Generate metrics HTML
+        if self.metrics:
+            write('<div class="metrics-grid">')
+            format_value = self.format_value
+            for metric in self.metrics:
+                label, value, value_format, change, change_label = (
+                    metric.label, metric.value, metric.format,
+                    metric.change, metric.change_label
+                )
+                change_html = ""
+                if change is not None:
+                    change_class = "positive" if change >= 0 else "negative"
+                    change_html = f'<div class="change {change_class}">{_escape(change_label)} {abs(change):.1f}%</div>'
+                
+                write(f"""
+                <div class="metric-card">
+                    <div class="metric-label">{_escape(label)}</div>
+                    <div class="metric-value">{_escape(format_value(value, value_format))}</div>
+                    {change_html}
+                </div>
+                """)
+            write('</div>')
+        write('\n    \n    ')
+        
+        # Generate charts HTML; all chart data is serialized once into a single
+        # JSON blob that the browser parses once, instead of one literal per chart
+        if self.charts:
+            chart_data = {_chart_id(i): _chart_columns(chart) for i, chart in enumerate(self.charts)}
+            write('<script id="dashboard-data" type="application/json">')
+            # Escape "</" so values can't close the script element early
+            write(_dumps(chart_data).replace('</', '<\\/'))
+            write('</script>')
+            write("<script>window.__dashData = JSON.parse(document.getElementById('dashboard-data').textContent);</script>")
+            for i, chart in enumerate(self.charts):
+                write('<div class="chart-container"><div class="chart-wrapper">')
+                write(self.generate_chart_js(chart, i))
+                write('</div></div>')
+        write('\n    \n    ')
+        
+        # Generate tables HTML
+        for table in self.tables:
+            title, rows, columns = table.title, table.data, table.columns
+            write(f"""
+            <div class="table-container">
+                <h3>{_escape(title)}</h3>
+                <table class="data-table">
+                    """)
+            
+            if isinstance(rows, pd.DataFrame):
+                rows = rows.to_dict('records')
+            
+            # Build table header
+            write('<thead><tr>' + ''.join(f'<th>{_escape(col)}</th>' for col in columns) + '</tr></thead>')
+            
+            # Build table body; numeric columns get thousands separators. Each
+            # row is filled into a per-table template with a single format call
+            cells = list(zip(columns, [_pick_cell_formatter(rows, col) for col in columns]))
+            row_template = '<tr>' + '<td>{}</td>' * len(columns) + '</tr>'
+            write('<tbody>')
+            for row in rows:
+                write(row_template.format(*[fmt(row.get(col, '')) for col, fmt in cells]))
+            write('</tbody>')
+            
+            write("""
+                </table>
+            </div>
+            """)
+        
+        write(_PAGE_TAIL)
+        return None
+    
+    def save_dashboard(self, filepath: str, compress: bool = False):
+        """
+        Save dashboard to HTML file
+        
+        Args:
+            filepath: Output path
+            compress: Write gzip-compressed HTML to filepath + '.gz' instead;
+                worthwhile for dashboards with large embedded data
+        
+        Returns:
+            Path of the written file
+        """
+        if compress:
+            filepath = filepath + '.gz'
+        # Stream sections to a temporary file next to the target rather than
+        # building the page in memory; the target is only replaced once the
+        # page is complete, so a failure leaves an existing dashboard intact
+        tmp_path = filepath + '.tmp'
+        try:
+            if compress:
+                # Level 1 compresses HTML/JSON nearly as well as the default, much faster
+                with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                    self.generate_html(out=f)
+            else:
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    self.generate_html(out=f)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         return filepath
 
 
 def create_dashboard_from_analysis(analysis_results: Dict[str, Any], 
-                                    title: str = "Analysis Dashboard") -> str:
+                                    title: str = "Analysis Dashboard",
+                                    filepath: Optional[str] = None) -> str:
     """
     Create HTML dashboard from analysis framework results
     
     Args:
         analysis_results: Results from analysis framework
         title: Dashboard title
+        filepath: Output path; defaults to a timestamped dashboard_*.html
     
     Returns:
         Path to saved HTML file
     """
     generator = HTMLDashboardGenerator()
     generator.title = title
-    generator.description = f"Analysis results from {len(analysis_results.get('steps', []))} steps"
+    steps = analysis_results.get('steps', [])
+    generator.description = f"Analysis results from {len(steps)} steps"
     
-    # Extract metrics from analysis steps
-    for step in analysis_results.get('steps', []):
-        if step.get('row_count'):
-            generator.add_metric(
-                label=f"Step {step['step_number']} - Rows",
-                value=step['row_count'],
-                format="number"
-            )
+    # Extract metrics from analysis steps in one bulk extend
+    generator.metrics.extend(
+        Metric(f"Step {step['step_number']} - Rows", step['row_count'], "number", None, "")
+        for step in steps
+        if step.get('row_count')
+    )
     
     # Add execution time metric
     if analysis_results.get('total_execution_time'):
@@ -454,9 +645,35 @@ def create_dashboard_from_analysis(analysis_results: Dict[str, Any],
         )
     
     # Save and return path
-    filepath = f"dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+    if filepath is None:
+        filepath = f"dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
     generator.save_dashboard(filepath)
     return filepath
 
 
-
+def create_dashboards_bulk(analyses: List[Dict[str, Any]],
+                           title: str = "Analysis Dashboard",
+                           max_workers: Optional[int] = None) -> List[str]:
+    """
+    Create one HTML dashboard per analysis result, rendering them in parallel
+    
+    Rendering is CPU-bound (serialization and string building), so each
+    dashboard is built in its own worker process.
+    
+    Args:
+        analyses: Results from analysis framework, one per dashboard
+        title: Dashboard title
+        max_workers: Maximum worker processes (defaults to the CPU count)
+    
+    Returns:
+        Paths to saved HTML files, in the order given
+    """
+    # Dashboards rendered within the same second would share a timestamped
+    # name, so number them
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filepaths = [f"dashboard_{timestamp}_{i}.html" for i in range(1, len(analyses) + 1)]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            create_dashboard_from_analysis, analyses, [title] * len(analyses), filepaths
+        ))
@@ -2,13 +2,57 @@
 Generate Final Report: Data Quality, EDA, and Engagement Weights Analysis
 """
 
+import os
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from typing import Iterator
+
+# Optional: pyarrow parses the CSV in parallel blocks
+try:
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+# pd.read_csv's default missing-value markers, so both readers agree on nulls
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
 
 def load_data(file_path):
-    """Load the CSV file into a pandas DataFrame"""
-    return pd.read_csv(file_path)
+    """Load the CSV file into a pandas DataFrame with compact dtypes"""
+    if pa_csv is not None:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=64 << 20),
+            # pyarrow otherwise keeps "" and "NA" as strings in text columns
+            convert_options=pa_csv.ConvertOptions(
+                strings_can_be_null=True,
+                null_values=CSV_NA_VALUES
+            )
+        )
+        # NumPy-backed columns, so the downcasting below applies unchanged
+        df = table.to_pandas()
+    else:
+        df = pd.read_csv(file_path)
+    
+    # Activity counts and the churn flag fit in small unsigned ints, which
+    # shrinks the memory the corr/describe/value_counts scans read
+    count_columns = [
+        'Num_Logins', 'Num_Searches', 'Num_Card_Views',
+        'Num_API_Calls', 'Num_Exports', 'Num_Emails_Sent', 'Churned'
+    ]
+    df[count_columns] = df[count_columns].apply(pd.to_numeric, downcast='unsigned')
+    
+    # Repetitive strings (e.g. Subscription_Tier) become categoricals;
+    # mostly-unique ones like User_ID stay as they are
+    for col in df.select_dtypes(include='object').columns:
+        if df[col].nunique() < len(df) // 2:
+            df[col] = df[col].astype('category')
+    
+    return df
 
 def calculate_correlations(df):
     """Calculate correlation between numerical activity columns and Churned status"""
@@ -16,28 +60,31 @@ def calculate_correlations(df):
         'Num_Logins', 'Num_Searches', 'Num_Card_Views', 
         'Num_API_Calls', 'Num_Exports', 'Num_Emails_Sent'
     ]
-    correlations = {col: df[col].corr(df['Churned']) for col in activity_columns}
+    # One correlation matrix instead of a separate .corr() per column
+    correlations = df[activity_columns + ['Churned']].corr()['Churned'].drop('Churned').to_dict()
     return correlations, activity_columns
 
 def calculate_weights(correlations):
     """Calculate engagement weights"""
-    inverted_correlations = {k: -v for k, v in correlations.items()}
-    values = list(inverted_correlations.values())
-    min_val = min(values)
-    max_val = max(values)
+    columns = list(correlations)
+    inverted = -np.fromiter(correlations.values(), dtype=np.float64, count=len(columns))
+    min_val = inverted.min()
+    max_val = inverted.max()
     
-    weights = {}
-    for col, val in inverted_correlations.items():
-        if max_val == min_val:
-            weight = 5.5
-        else:
-            weight = 1 + (val - min_val) / (max_val - min_val) * 9
-        weights[col] = round(weight, 2)
+    # Scale all inverted correlations to 1-10 in one vector op
+    if max_val == min_val:
+        scaled = np.full(inverted.shape, 5.5)
+    else:
+        scaled = 1 + (inverted - min_val) * (9 / (max_val - min_val))
     
+    weights = dict(zip(columns, np.round(scaled, 2).tolist()))
+    inverted_correlations = dict(zip(columns, inverted.tolist()))
     return weights, inverted_correlations
 
-def generate_report():
-    """Generate comprehensive final report"""
+def generate_report() -> Iterator[str]:
+    """Generate comprehensive final report, yielding it in Markdown chunks"""
+    
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # Load data
     df = load_data('saas_aggregated_data.csv')
@@ -54,9 +101,9 @@ def generate_report():
     churn_pct = df['Churned'].value_counts(normalize=True).sort_index() * 100
     
     # Generate report
-    report = f"""# B2B SaaS User Activity Analysis - Final Report
+    yield f"""# B2B SaaS User Activity Analysis - Final Report
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated:** {generated_at}
 
 ---
 
@@ -77,46 +124,47 @@ This report presents a comprehensive analysis of B2B SaaS user activity data, in
 """
     
     if missing_values.sum() == 0:
-        report += """
+        yield """
 ✅ **PASS:** No missing values found in any column.
 
 All columns are complete with no null values detected.
 """
     else:
-        report += "\n⚠️ **WARNING:** Missing values detected:\n\n"
-        for col, count in missing_values[missing_values > 0].items():
-            pct = (count / len(df) * 100)
-            report += f"- `{col}`: {count:,} missing ({pct:.2f}%)\n"
+        yield "\n⚠️ **WARNING:** Missing values detected:\n\n"
+        yield from (
+            f"- `{col}`: {count:,} missing ({count / len(df) * 100:.2f}%)\n"
+            for col, count in missing_values[missing_values > 0].items()
+        )
     
-    report += f"""
+    yield f"""
 ### 1.2 Duplicate Records
 
 """
     
     if total_duplicates == 0:
-        report += "✅ **PASS:** No duplicate rows found.\n\n"
+        yield "✅ **PASS:** No duplicate rows found.\n\n"
     else:
-        report += f"⚠️ **WARNING:** Found {total_duplicates:,} duplicate rows ({total_duplicates/len(df)*100:.2f}%)\n\n"
+        yield f"⚠️ **WARNING:** Found {total_duplicates:,} duplicate rows ({total_duplicates/len(df)*100:.2f}%)\n\n"
     
     if duplicate_user_ids == 0:
-        report += "✅ **PASS:** No duplicate User_IDs found.\n\n"
+        yield "✅ **PASS:** No duplicate User_IDs found.\n\n"
     else:
-        report += f"❌ **ERROR:** Found {duplicate_user_ids:,} duplicate User_IDs ({duplicate_user_ids/len(df)*100:.2f}%)\n\n"
+        yield f"❌ **ERROR:** Found {duplicate_user_ids:,} duplicate User_IDs ({duplicate_user_ids/len(df)*100:.2f}%)\n\n"
     
-    report += f"""
+    yield f"""
 ### 1.3 Data Types
 
 | Column | Data Type | Non-Null Count | Total Count |
 |--------|-----------|----------------|-------------|
 """
     
-    for col in df.columns:
-        dtype = str(df[col].dtype)
-        non_null = df[col].count()
-        total = len(df)
-        report += f"| `{col}` | {dtype} | {non_null:,} | {total:,} |\n"
+    non_null_counts = len(df) - missing_values
+    yield from (
+        f"| `{col}` | {dtype} | {non_null_counts[col]:,} | {len(df):,} |\n"
+        for col, dtype in df.dtypes.items()
+    )
     
-    report += f"""
+    yield f"""
 ---
 
 ## 2. Target Variable Analysis
@@ -165,9 +213,9 @@ All activity metrics show **negative correlations** with churn, which is expecte
     for col in activity_columns:
         corr = correlations[col]
         interpretation = "Strong negative" if abs(corr) > 0.1 else "Moderate negative" if abs(corr) > 0.05 else "Weak negative"
-        report += f"| `{col}` | {corr:.4f} | {interpretation} correlation - Higher {col.lower()} associated with lower churn |\n"
+        yield f"| `{col}` | {corr:.4f} | {interpretation} correlation - Higher {col.lower()} associated with lower churn |\n"
     
-    report += f"""
+    yield f"""
 **Visualization:** See `correlation_heatmap.png`
 
 ### 4.2 Correlation Insights
@@ -209,12 +257,12 @@ weight = 1 + (inverted_correlation - min) / (max - min) × 9
 |-----------------|---------------------|---------------------|
 """
     
-    for col in activity_columns:
-        orig = correlations[col]
-        inv = inverted_correlations[col]
-        report += f"| `{col}` | {orig:.4f} | {inv:.4f} |\n"
+    yield from (
+        f"| `{col}` | {correlations[col]:.4f} | {inverted_correlations[col]:.4f} |\n"
+        for col in activity_columns
+    )
     
-    report += f"""
+    yield f"""
 ### 5.3 Final Engagement Weights
 
 **AI-Recommended Weights for Scoring Model (1-10 Scale):**
@@ -235,9 +283,9 @@ weight = 1 + (inverted_correlation - min) / (max - min) × 9
             level = "🟢 Low"
         else:
             level = "⚪ Very Low"
-        report += f"| `{col}` | **{weight:.2f}** | {level} |\n"
+        yield f"| `{col}` | **{weight:.2f}** | {level} |\n"
     
-    report += f"""
+    yield f"""
 **Visualization:** See `engagement_weights_bar_chart.png`
 
 ### 5.4 Python Dictionary (Ready to Use)
@@ -246,10 +294,9 @@ weight = 1 + (inverted_correlation - min) / (max - min) × 9
 weights = {{
 """
     
-    for col, weight in sorted_weights:
-        report += f"    '{col}': {weight:.2f},\n"
+    yield from (f"    '{col}': {weight:.2f},\n" for col, weight in sorted_weights)
     
-    report += """}
+    yield """}
 ```
 
 ---
@@ -260,15 +307,15 @@ weights = {{
 """
     
     if missing_values.sum() == 0 and total_duplicates == 0 and duplicate_user_ids == 0:
-        report += """
+        yield """
 ✅ **Excellent Data Quality:** The dataset is clean with no missing values, duplicates, or data quality issues detected. Safe to proceed with analysis.
 """
     else:
-        report += """
+        yield """
 ⚠️ **Data Quality Issues Detected:** Review the sanity check section above for details. Consider data cleaning before model deployment.
 """
     
-    report += f"""
+    yield f"""
 ### 6.2 Engagement Insights
 
 1. **Top Engagement Indicators:**
@@ -321,9 +368,10 @@ weights = {{
 
 """
     
+    summary = df[activity_columns].describe().T
     for col in activity_columns:
-        stats = df[col].describe()
-        report += f"""
+        stats = summary.loc[col]
+        yield f"""
 **{col}:**
 - Mean: {stats['mean']:.2f}
 - Median: {stats['50%']:.2f}
@@ -332,15 +380,13 @@ weights = {{
 - Max: {stats['max']:.0f}
 """
     
-    report += f"""
+    yield f"""
 
 ---
 
-**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Report Generated:** {generated_at}
 **Analysis Framework:** Python 3 with pandas, numpy, matplotlib, seaborn
 """
-    
-    return report
 
 def main():
     """Generate and save the final report"""
@@ -348,11 +394,18 @@ def main():
     print("GENERATING FINAL REPORT")
     print("="*80)
     
-    report = generate_report()
-    
-    # Save as Markdown
-    with open('FINAL_REPORT.md', 'w', encoding='utf-8') as f:
-        f.write(report)
+    # Stream the report to a temporary file as it is generated and only
+    # replace FINAL_REPORT.md once it is complete, so a failure (e.g. a
+    # missing CSV) leaves the previous report intact
+    tmp_path = 'FINAL_REPORT.md.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(generate_report())
+        os.replace(tmp_path, 'FINAL_REPORT.md')
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     
     print("✓ Final report saved: FINAL_REPORT.md")
     print("\n" + "="*80)
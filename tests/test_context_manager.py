@@ -0,0 +1,105 @@
+"""
+Tests for question-to-schema mapping in context_manager.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "analysis_scripts"))
+
+from context_manager import ContextManager
+
+
+SCHEMA = {
+    'models': [
+        {'name': 'user', 'synonyms': ['member', 'customer'], 'description': 'Registered people using the product'},
+        {'name': 'subscriptions', 'synonyms': ['plans'], 'description': 'Paid plans per account'},
+        {'name': 'accounts', 'synonyms': ['organizations'], 'description': 'Company records with industry'},
+    ],
+    'common_metrics': [
+        {'name': 'churn rate', 'synonyms': ['churn'], 'calculation': 'churned / total'},
+        {'name': 'MRR', 'synonyms': ['monthly recurring revenue'], 'calculation': 'SUM(monthly_price)'},
+    ],
+    'common_business_questions': [
+        {
+            'question': 'What is our MRR by subscription plan?',
+            'synonyms': ['mrr by plan'],
+            'query_pattern': 'SELECT 1',
+            'tables': ['subscriptions', 'accounts'],
+            'metrics': ['MRR'],
+        },
+    ],
+}
+
+QUESTIONS = [
+    "What is the churn rate for users?",
+    "Show customers by industry",
+    "How many users churned last month?",
+    "how many members?",
+    "What's our MRR by plan?",
+    "monthly recurring revenue for organizations",
+]
+
+
+def _context_manager() -> ContextManager:
+    cm = ContextManager("owner", "repo")
+    cm._set_schema_context(SCHEMA)
+    return cm
+
+
+def _names(mapping, key):
+    return [entry['name'] for entry in mapping[key]]
+
+
+def test_substring_matches_without_automaton():
+    cm = _context_manager()
+    cm._phrase_automaton = None
+    
+    mapping = cm.map_user_question_to_schema("How many users churned last month?")
+    assert _names(mapping, 'tables') == ['user']
+    assert _names(mapping, 'metrics') == ['churn rate']
+    
+    mapping = cm.map_user_question_to_schema("how many members?")
+    assert _names(mapping, 'tables') == ['user']
+
+
+def test_cached_mapping_is_not_shared_with_callers():
+    cm = _context_manager()
+    mapping = cm.map_user_question_to_schema("how many members?")
+    mapping['tables'].append({'name': 'extra'})
+    mapping['tables'][0]['synonyms'].append('extra')
+    
+    again = cm.map_user_question_to_schema("how many members?")
+    assert _names(again, 'tables') == ['user']
+    assert again['tables'][0]['synonyms'] == ['member', 'customer']
+
+
+def test_business_question_synonym_uses_declared_entities():
+    cm = _context_manager()
+    mapping = cm.map_user_question_to_schema("Show me MRR by plan")
+    assert mapping['query_pattern'] == 'SELECT 1'
+    assert _names(mapping, 'tables') == ['subscriptions', 'accounts']
+    assert _names(mapping, 'metrics') == ['MRR']
+
+
+def test_weak_business_question_match_keeps_scan_results():
+    cm = _context_manager()
+    mapping = cm.map_user_question_to_schema("What is the churn rate for users?")
+    # Only the query pattern comes from the loosely matched question
+    assert mapping['query_pattern'] == 'SELECT 1'
+    assert _names(mapping, 'tables') == ['user']
+    assert _names(mapping, 'metrics') == ['churn rate']
+
+
+def test_automaton_and_fallback_give_same_mapping():
+    pytest.importorskip("ahocorasick")
+    cm = _context_manager()
+    assert cm._phrase_automaton is not None
+    with_automaton = {q: cm.map_user_question_to_schema(q) for q in QUESTIONS}
+    
+    cm._phrase_automaton = None
+    cm._mapping_cache.cache_clear()
+    for question in QUESTIONS:
+        assert cm.map_user_question_to_schema(question) == with_automaton[question]